@@ -1,16 +1,66 @@
+import ast
 import asyncio
+import argparse
+import inspect
+import sys
+import functools
 import logging
-import json
+import os
+import queue
 from prompt_toolkit import HTML
 from prompt_toolkit.patch_stdout import patch_stdout
 from prompt_toolkit import PromptSession
-from prompt_toolkit.history import FileHistory
+from prompt_toolkit.history import FileHistory, ThreadedHistory
 
 from vsslctrl import Vssl, DeviceModels, Zone, ZoneIDs
 
-from logging.handlers import RotatingFileHandler
+# Optional: use uvloop for lower event loop overhead if it is installed
+try:
+    import uvloop
 
-rfh = RotatingFileHandler(
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Optional: use orjson for dumping zone state e.g "dumps(zone1.track.as_dict())"
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    from json import dumps
+
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+
+class SizeTrackingRotatingFileHandler(RotatingFileHandler):
+    """Keep count of the bytes written instead of checking the file on each emit"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._bytes_written = (
+            os.path.getsize(self.baseFilename)
+            if os.path.isfile(self.baseFilename)
+            else 0
+        )
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0:
+            return False
+
+        size = len(self.format(record).encode(errors="replace")) + len(self.terminator)
+
+        if self._bytes_written and self._bytes_written + size >= self.maxBytes:
+            self._bytes_written = size
+            return True
+
+        self._bytes_written += size
+        return False
+
+
+rfh = SizeTrackingRotatingFileHandler(
     filename="vssl.log",
     mode="a",
     maxBytes=1 * 1024 * 1024,
@@ -19,25 +69,100 @@ rfh = RotatingFileHandler(
     delay=0,
 )
 
+rfh.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
 
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(message)s", handlers=[rfh]
-)
+# Log records are only queued on the event loop, the listener thread does the
+# actual file write and rotation so log output doesnt stall the zone sockets.
+#
+# Rollover is left on the listener thread rather than handed to another worker,
+# records queue up behind it while the file is renamed and reopened.
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, rfh, respect_handler_level=True)
+
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+
+EXIT_COMMANDS = frozenset({"exit", "quit", ":q"})
+
+
+# Commands are often repeated from the history, so reuse their code objects.
+#
+# Top level await is allowed so commands can wait without blocking the event
+# loop e.g "await asyncio.sleep(5)" instead of "time.sleep(5)". The flag was
+# added in Python 3.8, older versions can still run plain (non await) commands
+_TOP_LEVEL_AWAIT = getattr(ast, "PyCF_ALLOW_TOP_LEVEL_AWAIT", 0)
 
 
-async def main():
-    vssl = Vssl(DeviceModels.A3X)
-    # vssl = Vssl('a3x')
-    zone1 = vssl.add_zone(ZoneIDs.ZONE_1, "192.168.1.10")
-    zone2 = vssl.add_zone(ZoneIDs.ZONE_2, "192.168.1.11")
-    zone3 = vssl.add_zone(ZoneIDs.ZONE_3, "192.168.1.12")
+@functools.lru_cache(maxsize=256)
+def _compile(source: str):
+    return compile(source, "<cli>", "single", flags=_TOP_LEVEL_AWAIT)
+
+
+# Most commands are a simple method call e.g "zone1.volume_raise(5)". These are
+# parsed once into (name, attribute path, literal args) and called directly
+@functools.lru_cache(maxsize=256)
+def _parse_call(source: str):
+    try:
+        node = ast.parse(source, mode="eval").body
+        if not isinstance(node, ast.Call) or node.keywords:
+            return None
+        call_args = tuple(ast.literal_eval(arg) for arg in node.args)
+    except (SyntaxError, ValueError):
+        return None
+
+    attrs = []
+    func = node.func
+    while isinstance(func, ast.Attribute):
+        attrs.insert(0, func.attr)
+        func = func.value
+
+    if not isinstance(func, ast.Name) or not attrs:
+        return None
+
+    return func.id, tuple(attrs), call_args
+
+
+def _run_command(source: str, namespace: dict):
+    call = _parse_call(source)
+    if call is not None and call[0] in namespace:
+        name, attrs, call_args = call
+        target = namespace[name]
+        for attr in attrs:
+            target = getattr(target, attr)
+        result = target(*call_args)
+        if not inspect.iscoroutine(result):
+            # Echo the result the same way the compiled path does
+            sys.displayhook(result)
+        return result
+
+    return eval(_compile(source), globals(), namespace)
+
+
+async def main(args: argparse.Namespace):
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    log_listener.start()
+    logging.debug("Event loop: %s", type(asyncio.get_running_loop()).__name__)
+
+    hosts = {
+        ZoneIDs.ZONE_1: args.ip1,
+        ZoneIDs.ZONE_2: args.ip2,
+        ZoneIDs.ZONE_3: args.ip3,
+    }
+
+    vssl = Vssl(args.model)
+    vssl.add_zones({zone_id: ip for zone_id, ip in hosts.items() if ip})
+    zone1 = vssl.get_zone(ZoneIDs.ZONE_1)
+    zone2 = vssl.get_zone(ZoneIDs.ZONE_2)
+    zone3 = vssl.get_zone(ZoneIDs.ZONE_3)
 
     try:
         # print(await vssl.discover())
 
         await vssl.initialise()
 
-        history = FileHistory("command_history.txt")
+        # Load the history file off the event loop
+        history = ThreadedHistory(FileHistory("command_history.txt"))
         session = PromptSession(history=history)
 
         while True:
@@ -45,12 +170,18 @@ async def main():
                 user_input = await session.prompt_async(
                     'Enter a message ("exit" to quit): '
                 )
+                user_input = user_input.strip()
 
-                if user_input.lower() == "exit":
+                if not user_input:
+                    continue
+
+                if user_input.casefold() in EXIT_COMMANDS:
                     break
 
                 try:
-                    exec(user_input)
+                    result = _run_command(user_input, locals())
+                    if inspect.iscoroutine(result):
+                        await result
                 except Exception as e:
                     logging.info(e)
 
@@ -67,6 +198,23 @@ async def main():
         print(e)
     finally:
         await vssl.shutdown()
-
-
-asyncio.run(main())
+        log_listener.stop()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="vsslctrl development CLI")
+    parser.add_argument(
+        "--model",
+        default="A3X",
+        choices=[model.name for model in DeviceModels],
+        type=str.upper,
+        help="VSSL device model",
+    )
+    parser.add_argument("--ip1", default="192.168.1.10", help="Zone 1 IP address")
+    parser.add_argument("--ip2", default="192.168.1.11", help="Zone 2 IP address")
+    parser.add_argument("--ip3", default="192.168.1.12", help="Zone 3 IP address")
+    parser.add_argument("--debug", action="store_true", help="Log at DEBUG level")
+    return parser.parse_args()
+
+
+asyncio.run(main(parse_args()))
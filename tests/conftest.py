@@ -1,14 +1,193 @@
+import os
+import asyncio
 import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+
+import vsslctrl as vssl_module
+from vsslctrl.zone import Zone
+from vsslctrl.api_base import APIBase
+from vsslctrl.io import InputRouter
+from vsslctrl.utils import wait_with_timeout
+
+
+SETUP_TIMEOUT = 5
+rtt_key = pytest.StashKey[float]()
+
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "integration: mark test as integration test")
+    config.addinivalue_line(
+        "markers", "xdist_group(name): keep tests on one pytest-xdist worker"
+    )
+
 
 def pytest_addoption(parser):
     parser.addoption("--integration", action="store_true", help="Run integration tests")
     parser.addoption("--ip", action="store", help="IP address for integration tests")
-    parser.addoption("--zone", default=1, action="store", help="IP address for integration tests")
+    parser.addoption("--zone", default="1", action="store", help="Zone ID(s) for integration tests, comma separated to spread across xdist workers")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run every async test on the session event loop and skip tests marked
+    'integration' unless an ip address is given."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+    if config.getoption("--ip"):
+        return
+
+    skip_integration = pytest.mark.skip(
+        reason="use --ip and an ip address to run integration tests."
+    )
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+#
+# Shared fixtures
+#
+# Test modules pick which zone they run against by defining a `zone` fixture
+# that returns either `mock_zone` or `live_zone`, each Vssl is only created
+# once per session.
+#
+# Async only because the Vssl event bus needs a running loop, the zone is
+# never connected so teardown just stops the bus
+@pytest_asyncio.fixture(scope="session")
+async def mock_zone():
+    vssl_instance = vssl_module.Vssl()
+    zone_instance = vssl_instance.add_zone(1, "192.168.168.1")
+
+    # Yield the device to the test function
+    yield zone_instance
+
+    vssl_instance.event_bus.stop()
+
+
+# A new Vssl per test, for tests that change its state. The bus is stopped
+# even when the test fails
+@pytest_asyncio.fixture
+async def fresh_vssl():
+    vssl_instance = vssl_module.Vssl()
+    try:
+        yield vssl_instance
+    finally:
+        vssl_instance.event_bus.stop()
+
+
+@pytest_asyncio.fixture
+async def fresh_zone(fresh_vssl):
+    return fresh_vssl.add_zone(2, "192.168.168.1")
+
+
+# Capture the requests rather than queuing them for a connection. The APIs use
+# __slots__ so send is patched on the class, APIBase for both APIs unless a
+# test narrows it with indirect parametrization e.g
+# @pytest.mark.parametrize("sent", [APIAlpha], indirect=True)
+@pytest.fixture
+def sent(request, monkeypatch):
+    api_class = getattr(request, "param", APIBase)
+    requests = []
+    monkeypatch.setattr(api_class, "send", lambda self, data: requests.append(data))
+    return requests
+
+
+#
+# Zones driven by the test run, one per pytest-xdist worker from the comma
+# separated --zone list. Workers sharing a zone would race each other's
+# volume, transport and group changes
+#
+def worker_zones(config):
+    zone = config.option.zone
+    if zone is None:
+        pytest.fail("No Zone specified. Use the --zone option.")
+
+    zones = [int(zone_id) for zone_id in str(zone).split(",")]
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+    if workers > len(zones):
+        pytest.fail(
+            f"{workers} xdist workers but only {len(zones)} zone(s) given, "
+            f"run with -n {len(zones)} or pass more zones with --zone"
+        )
+    return zones[:workers]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def live_zone(request):
+    ip = request.config.option.ip
+    if ip is None:
+        pytest.fail("No ip address specified. Use the --ip option.")
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    zone = worker_zones(request.config)[int(worker.lstrip("gw") or 0)]
+
+    vssl_instance = vssl_module.Vssl()
+    zone_instance = vssl_instance.add_zone(zone, ip)
+
+    # Keep hold of the task so it is cancelled on failure and awaited at
+    # teardown, rather than left dangling on the session loop
+    init_task = asyncio.ensure_future(vssl_instance.initialise())
+
+    try:
+        await wait_with_timeout(zone_instance.initialisation.wait(), 3)
+    except asyncio.TimeoutError:
+        init_task.cancel()
+        await asyncio.gather(init_task, return_exceptions=True)
+        await vssl_instance.shutdown()
+        pytest.fail(f"Couldnt connect to Zone at {ip}, not initialised")
+
+    if not zone_instance.transport.is_playing or zone_instance.input.source != InputRouter.Sources.STREAM:
+        pytest.fail(
+            "Integration tests on the VSSL class must be run "
+            "with the VSSL zone playing a stream (not analog input)"
+        )
+
+    original_volume = zone_instance.volume
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    future_vol = vssl_instance.event_bus.future(Zone.Events.VOLUME_CHANGE, zone_instance.id)
+    zone_instance.volume = 50
+    await vssl_instance.event_bus.wait_future(future_vol, SETUP_TIMEOUT)
+    request.config.stash[rtt_key] = loop.time() - started
+
+    # Yield the device to the test function
+    yield zone_instance
+
+    # Tear down. Restore state
+    future_vol = vssl_instance.event_bus.future(Zone.Events.VOLUME_CHANGE, zone_instance.id)
+    zone_instance.volume = original_volume
+    await vssl_instance.event_bus.wait_future(future_vol, SETUP_TIMEOUT)
+
+    await init_task
+    await vssl_instance.disconnect()
+
+
+# A zone on the device no worker is driving, safe to group with the live zone
+@pytest.fixture(scope="session")
+def group_member(live_zone, request):
+    owned = worker_zones(request.config)
+    free = [zone_id for zone_id in live_zone.vssl.model.zones if zone_id not in owned]
+    if not free:
+        pytest.skip("No zone free of the test workers to group with")
+    return free[0]
+
+
+# Round-trip time measured while setting up the live zone
+@pytest.fixture(scope="session")
+def rtt(live_zone, request):
+    return request.config.stash[rtt_key]
+
+
+# Module scoped as `zone` differs between the mock and live modules
+@pytest.fixture(scope="module")
+def eb(zone):
+    return zone.vssl.event_bus
+
 
-def pytest_runtest_setup(item):
-    """Skip tests marked 'integration' unless an ip address is given."""
-    if "integration" in item.keywords and not item.config.getoption("--ip"):
-        pytest.skip("use --ip and an ip address to run integration tests.")
\ No newline at end of file
+@pytest.fixture(scope="module")
+def vssl(zone):
+    return zone.vssl
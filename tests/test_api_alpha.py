@@ -0,0 +1,380 @@
+import asyncio
+import socket
+
+import pytest
+
+from vsslctrl import api_alpha, api_base
+from vsslctrl.api_alpha import APIAlpha
+from vsslctrl.api_base import APITaskGroup
+from vsslctrl.exceptions import ZoneConnectionError
+
+
+@pytest.fixture
+def zone(fresh_zone):
+    return fresh_zone
+
+
+class TestAlphaRequests:
+    def test_static_requests(self, zone, sent):
+        zone.api_alpha.request_action_17()
+        zone.api_alpha.request_action_00_08()
+        zone.api_alpha.request_action_19()
+        assert sent == [
+            bytes([16, 23, 1, 7]),
+            bytes([16, 0, 1, 8]),
+            bytes([16, 25, 1, 2]),
+        ]
+
+    async def test_volume_requests(self, zone, sent, monkeypatch):
+        # Send each step straight away
+        monkeypatch.setattr(APIAlpha, "VOLUME_STEP_WINDOW", 0)
+        api = zone.api_alpha
+        api.request_action_05(120)
+        api.request_action_05_raise()
+        api.request_action_05_lower()
+        api.request_action_05_08(30)
+        api.request_action_05_00(40)
+        api.request_action_05_01(50)
+        api.request_action_05_02(60)
+
+        assert sent == [
+            bytearray([16, 5, 3, 2, 100, 3]),
+            bytearray([16, 5, 3, 2, 255, 3]),
+            bytearray([16, 5, 3, 2, 254, 3]),
+            bytearray([16, 5, 3, 2, 30, 8]),
+            bytearray([16, 5, 3, 2, 40, 0]),
+            bytearray([16, 5, 3, 2, 50, 1]),
+            bytearray([16, 5, 3, 2, 60, 2]),
+        ]
+
+    async def test_volume_steps_coalesced(self, zone, sent):
+        api = zone.api_alpha
+        zone._volume = 20
+
+        api.request_action_05_raise()
+        api.request_action_05_raise()
+        api.request_action_05_raise()
+        api.request_action_05_lower()
+        assert sent == []
+
+        await asyncio.sleep(api.VOLUME_STEP_WINDOW * 2)
+        assert sent == [bytearray([16, 5, 3, 2, 22, 3])]
+
+        api.request_action_05_raise()
+        await asyncio.sleep(api.VOLUME_STEP_WINDOW * 2)
+        assert sent[1] == bytearray([16, 5, 3, 2, 255, 3])
+
+    async def test_volume_steps_follow_target(self, zone, sent):
+        api = zone.api_alpha
+        zone._volume = 20
+
+        # The zone volume has not caught up with the first batch yet
+        for _ in range(3):
+            api.request_action_05_raise()
+        await asyncio.sleep(api.VOLUME_STEP_WINDOW * 2)
+        for _ in range(2):
+            api.request_action_05_raise()
+        await asyncio.sleep(api.VOLUME_STEP_WINDOW * 2)
+
+        assert sent == [
+            bytearray([16, 5, 3, 2, 23, 3]),
+            bytearray([16, 5, 3, 2, 25, 3]),
+        ]
+
+        # Feedback resets the target to the reported volume
+        await api._handle_response(bytes([16, 6, 3, 2, 30, 3]))
+        for _ in range(2):
+            api.request_action_05_lower()
+        await asyncio.sleep(api.VOLUME_STEP_WINDOW * 2)
+        assert sent[2] == bytearray([16, 5, 3, 2, 28, 3])
+
+    async def test_disconnect_cancels_volume_steps(self, zone, sent):
+        api = zone.api_alpha
+        api.request_action_05_raise()
+        api.request_action_05_raise()
+        api._status_frames[8] = bytes([16, 0, 3, 8]) + b"{}"
+
+        await api.disconnect()
+        await asyncio.sleep(api.VOLUME_STEP_WINDOW * 2)
+
+        assert api._volume_steps_handle is None
+        assert api._status_frames == {}
+        assert sent == []
+
+    def test_rename_analog_input(self, zone, sent):
+        zone.api_alpha.request_action_15(" Turntable ")
+        assert sent == [bytearray([16, 21, 10, 2]) + b"Turntable"]
+
+    def test_rename_optical_input(self, zone, sent):
+        zone.api_alpha.request_action_15_12("TV")
+        assert sent == [bytearray([16, 21, 3, 12]) + b"TV"]
+
+    def test_rename_device(self, zone, sent):
+        zone.api_alpha.request_action_18("Lounge")
+        assert sent == [bytearray([16, 24, 7, 7]) + b"Lounge"]
+
+    def test_rename_length_counts_utf8_bytes(self, zone, sent):
+        zone.api_alpha.request_action_18("Café")
+        assert sent == [bytearray([16, 24, 6, 7]) + "Café".encode("utf-8")]
+
+    def test_play_url(self, zone, sent):
+        url = "http://host/a.mp3"
+        string = b"PLAYITEM:DIRECT:" + url.encode()
+
+        zone.api_alpha.request_action_55(url)
+        zone.api_alpha.request_action_55(url, all_zones=True)
+
+        assert sent == [
+            bytearray([16, 85, len(string) + 2, 2, zone.volume]) + string,
+            bytearray([16, 85, len(string) + 2, 0, zone.volume]) + string,
+        ]
+
+    def test_transport_requests(self, zone, sent):
+        states = zone.transport.States
+        for state in (states.PLAY, states.STOP, states.PAUSE):
+            zone.api_alpha.request_action_3D(state)
+        zone.api_alpha.request_action_3D(99)
+
+        assert sent == [
+            bytearray([16, 61, 2, 2, 0]),
+            bytearray([16, 61, 2, 2, 1]),
+            bytearray([16, 61, 2, 2, 2]),
+        ]
+
+    async def test_batch_requests(self, zone):
+        api = zone.api_alpha
+        api._create_events()
+        api.connection_event.set()
+
+        with api.batch():
+            api.request_action_05_raise()
+            api.request_action_05_raise()
+            assert not api._writer_queue
+
+        assert list(api._writer_queue) == [bytes([16, 5, 3, 2, 255, 3]) * 2]
+
+        # Nothing is left to be sent after the batch
+        await asyncio.sleep(api.VOLUME_STEP_WINDOW * 2)
+        assert len(api._writer_queue) == 1
+
+    def test_send_rejects_non_bytes(self, zone):
+        with pytest.raises(TypeError):
+            zone.api_alpha.send([16, 23, 1, 7])
+
+    async def test_send_coalesces_queued_requests(self, zone, monkeypatch):
+        written = []
+
+        class Writer:
+            def write(self, data):
+                written.append(bytes(data))
+
+            async def drain(self):
+                pass
+
+        api = zone.api_alpha
+        monkeypatch.setattr(APIAlpha, "SEND_COALESCE_BYTES", 8)
+        monkeypatch.setattr(APIAlpha, "SEND_INTERVAL", 0)
+        api._writer = Writer()
+        api._create_events()
+        api.connection_event.set()
+
+        for _ in range(3):
+            api.request_action_17()
+
+        task = asyncio.ensure_future(api._send_bytes())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert written == [bytes([16, 23, 1, 7]) * 2, bytes([16, 23, 1, 7])]
+
+
+class TestAlphaResponses:
+    async def test_volume_response(self, zone):
+        await zone.api_alpha._handle_response(bytes([16, 6, 3, 2, 35, 3]))
+        assert zone.volume == 35
+
+        await zone.api_alpha._handle_response(bytes([16, 6, 3, 2, 45, 8]))
+        assert zone.settings.volume.default_on == 45
+
+    async def test_hex_letter_action(self, zone):
+        # 0x2E, dispatch must match the upper case handler name
+        await zone.api_alpha._handle_response(bytes([16, 46, 2, 2, 1]))
+        assert zone.settings.eq.enabled is True
+
+    async def test_group_response_zone_guard(self, zone):
+        await zone.api_alpha._handle_response(bytes([16, 76, 3, 2, 1, 2]))
+        assert zone.group.source == 2
+        assert zone.group.is_master
+
+        # Another zone's group response is ignored
+        await zone.api_alpha._handle_response(bytes([16, 76, 3, 3, 0, 5]))
+        assert zone.group.source == 2
+
+    async def test_unknown_action(self, zone):
+        assert await zone.api_alpha._handle_response(bytes([16, 250, 1, 2])) is None
+
+    async def test_json_status_response(self, zone):
+        payload = b'{"id":"2","vol":"27","mt":"1"}'
+        response = bytes([16, 0, len(payload) + 1, 8]) + payload
+
+        await zone.api_alpha._handle_response(response)
+
+        assert zone.volume == 27
+        assert zone.mute is True
+
+    async def test_json_router_status_response(self, zone):
+        payload = b'{"eqsw":"1","inSrc":"3","Pwr":"1","AtPwr":"0"}'
+        response = bytes([16, 0, len(payload) + 1, 10]) + payload
+
+        await zone.api_alpha._handle_response(response)
+
+        assert zone.settings.eq.enabled is True
+        assert zone.input.source == 3
+        assert zone.vssl.settings.power.state == 1
+        assert zone.vssl.settings.power.adaptive is False
+
+    async def test_response_handler_tables(self, zone):
+        api = zone.api_alpha
+        assert api._action_handlers[0x2E] == api.response_action_2E
+        assert api._action_handlers[0xFA] == api.response_action_default
+        assert api._status_handlers[0x0A] == api.response_action_00_0A
+        assert api._status_handlers[0x01] is None
+
+    async def test_unknown_status_frame_not_parsed(self, zone, caplog):
+        response = bytes([16, 0, 3, 1]) + b"{!"
+        assert await zone.api_alpha._handle_response(response) is None
+        assert "Couldnt parse JSON" not in caplog.text
+
+    async def test_repeated_status_frame_skipped(self, zone, monkeypatch):
+        parsed = []
+        monkeypatch.setattr(
+            api_alpha, "json_loads", lambda data: parsed.append(data) or {}
+        )
+
+        payload = b'{"vol":"27"}'
+        response = bytes([16, 0, len(payload) + 1, 8]) + payload
+
+        await zone.api_alpha._handle_response(response)
+        await zone.api_alpha._handle_response(bytes(response))
+        assert len(parsed) == 1
+
+        await zone.api_alpha._handle_response(response[:-3] + b'8"}')
+        assert len(parsed) == 2
+
+    async def test_status_frame_applied_after_stop(self, zone, sent):
+        states = zone.transport.States
+        payload = b'{"ac":"1","lb":"4"}'
+        response = bytes([16, 0, len(payload) + 1, 8]) + payload
+
+        zone.transport._set_property("state", states.PLAY)
+        await zone.api_alpha._handle_response(response)
+        assert zone.track.source == 4
+
+        # Stopping resets the track, the same frame must be applied on play
+        zone.transport._set_property("state", states.STOP)
+        await zone._event_transport_state_change()
+        assert zone.track.source != 4
+
+        zone.transport._set_property("state", states.PLAY)
+        await zone.api_alpha._handle_response(response)
+        assert zone.track.source == 4
+
+    async def test_read_byte_stream(self, zone):
+        reader = asyncio.StreamReader()
+        reader.feed_data(bytes([2, 35, 3]))
+
+        await zone.api_alpha._read_byte_stream(reader, bytes([16, 6, 3]))
+        assert zone.volume == 35
+
+
+class TestAlphaConnection:
+    async def test_disconnect_stops_pending_reconnect(self, zone, monkeypatch):
+        async def open_connection(host, port):
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(asyncio, "open_connection", open_connection)
+
+        api = zone.api_alpha
+        task = api._keep_connected()
+        await asyncio.sleep(0)
+
+        await api.disconnect()
+
+        assert task.done()
+        assert not api.connected
+
+    async def test_events_created_on_connect(self, zone):
+        api = zone.api_alpha
+        assert api.connection_event is None
+        assert not api.connected
+
+        api.send(bytes([16, 23, 1, 7]))
+        assert not api._writer_queue
+
+        api._create_events()
+        event = api.connection_event
+        api._create_events()
+        assert api.connection_event is event
+
+    async def test_task_group_cancel_waits(self):
+        group = APITaskGroup()
+        group.extend([asyncio.sleep(60), asyncio.sleep(60)])
+        tasks = list(group.tasks)
+
+        await group.cancel()
+
+        assert all(task.done() for task in tasks)
+        assert group.tasks == []
+
+    async def test_receive_header_reads_frames(self, zone):
+        api = zone.api_alpha
+        api._reader = asyncio.StreamReader()
+        api._reader.feed_data(bytes([16, 6, 3, 2, 35, 3, 16, 6, 3, 2, 40, 3]))
+        api._create_events()
+        api.connection_event.set()
+
+        task = asyncio.ensure_future(api._receive_header())
+        await asyncio.sleep(0.01)
+        api.connection_event.clear()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert zone.volume == 40
+        assert api._keep_alive_received
+
+    async def test_reconnect_backoff_doubles(self, zone, monkeypatch):
+        delays = []
+
+        async def connect():
+            raise ZoneConnectionError("refused")
+
+        async def sleep(delay):
+            delays.append(delay)
+            if len(delays) == 7:
+                raise asyncio.CancelledError
+
+        api = zone.api_alpha
+        monkeypatch.setattr(api_base, "randrange", lambda stop: 0)
+        monkeypatch.setattr(api_base.asyncio, "sleep", sleep)
+        monkeypatch.setattr(APIAlpha, "connect", lambda self: connect())
+
+        with pytest.raises(asyncio.CancelledError):
+            await api._keep_connected_loop()
+
+        assert delays == [15, 30, 60, 120, 240, 300, 300]
+
+    async def test_tcp_keepalive_enabled(self, zone):
+        server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        api = zone.api_alpha
+        _, api._writer = await asyncio.open_connection("127.0.0.1", port)
+        api._set_tcp_keepalive()
+
+        sock = api._writer.get_extra_info("socket")
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+
+        api._writer.close()
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import pytest
+
+
+@pytest.fixture
+def zone(fresh_zone):
+    return fresh_zone
+
+
+def bravo_response(action: int, data: bytes = b""):
+    return (
+        bytes([170, 170, 1, 0, action, 0, 0, 0]) + len(data).to_bytes(2, "big") + data
+    )
+
+
+class TestBravoResponses:
+    async def test_name_response(self, zone):
+        await zone.api_bravo._handle_response(bravo_response(0x5A, b"Kitchen "))
+        assert zone.settings.name == "Kitchen"
+
+    async def test_extract_response_data(self, zone):
+        api = zone.api_bravo
+        assert api._extract_response_data(bravo_response(0x5A, b"Den") + b"!") == "Den"
+        assert api._extract_response_data(bravo_response(0x5A, b"\xff")) is None
+
+    async def test_read_byte_stream(self, zone):
+        frame = bravo_response(0x5A, b"Office")
+        reader = asyncio.StreamReader()
+        reader.feed_data(frame[10:])
+
+        await zone.api_bravo._read_byte_stream(reader, frame[:10])
+        assert zone.settings.name == "Office"
+
+    async def test_track_metadata_response(self, zone):
+        metadata = {
+            "CMD ID": 3,
+            "Window CONTENTS": {
+                "TrackName": "Beijing",
+                "Artist": "Ashkabad",
+            },
+        }
+        response = bravo_response(0x2A, json.dumps(metadata).encode())
+        # Track data is only kept while playing
+        zone.transport._set_property("state", zone.transport.States.PLAY)
+
+        await zone.api_bravo._handle_response(response)
+        assert zone.track.title == "Beijing"
+        assert zone.track.artist == "Ashkabad"
+
+    async def test_repeated_track_metadata(self, zone, sent):
+        metadata = {"CMD ID": 3, "Window CONTENTS": {"TrackName": "Beijing"}}
+        response = bravo_response(0x2A, json.dumps(metadata).encode())
+        zone.transport._set_property("state", zone.transport.States.PLAY)
+
+        await zone.api_bravo._handle_response(response)
+        zone.track.set_defaults()
+
+        # Same frame again is not parsed
+        await zone.api_bravo._handle_response(response)
+        assert zone.track.title != "Beijing"
+
+        # Until a refresh is requested
+        zone.api_bravo.request_action_2A(refresh=True)
+        await zone.api_bravo._handle_response(response)
+        assert zone.track.title == "Beijing"
+
+    async def test_unknown_action(self, zone):
+        response = bravo_response(0xFA)
+        assert await zone.api_bravo._handle_response(response) is None
+
+    async def test_keepalive_response_reregisters(self, zone, sent):
+
+        registered = bytearray(bravo_response(0x03))
+        registered[5] = 1
+        await zone.api_bravo._handle_response(bytes(registered))
+        assert sent == []
+
+        await zone.api_bravo._handle_response(bravo_response(0x03))
+        assert len(sent) == 1
+
+    async def test_response_handler_table(self, zone):
+        api = zone.api_bravo
+        assert api._action_handlers[0x5A] == api.response_action_5A
+        assert api._action_handlers[0x3F] == api.response_action_3F
+        assert api._action_handlers[0xFA] == api.response_action_default
+
+
+class TestBravoRequests:
+    def test_keepalive_request(self, zone, sent):
+
+        zone.api_bravo.request_action_03()
+        zone.api_bravo.request_action_03()
+
+        host = b"192.168.168.1"
+        expected = bytes([170, 170, 2, 3, 0, 0, 0, 0, len(host), 0]) + host
+        assert sent == [expected, expected]
+
+    def test_fixed_requests(self, zone, sent):
+
+        zone.api_bravo.request_action_5A()
+        zone.api_bravo.request_action_40_next()
+        zone.api_bravo.request_action_40_prev()
+
+        assert sent == [
+            bytes([170, 170, 1, 90, 0, 0, 0, 0, 0, 0]),
+            bytes([170, 170, 2, 40, 0, 0, 0, 0, 4, 0]) + b"NEXT",
+            bytes([170, 170, 2, 40, 0, 0, 0, 0, 8, 0]) + b"PREV",
+        ]
+
+    def test_rename_request_length(self, zone, sent):
+
+        zone.api_bravo.request_action_5A_set("Café")
+
+        name = "Café".encode("utf-8")
+        assert sent == [bytes([170, 170, 2, 90, 0, 0, 0, 0, len(name), 0]) + name]
@@ -0,0 +1,29 @@
+import asyncio
+
+from vsslctrl.zone import Zone
+
+
+class TestVsslZones:
+    async def test_add_zones_dict(self, fresh_vssl):
+        zones = fresh_vssl.add_zones({1: "192.168.168.10", 3: "192.168.168.12"})
+
+        assert [zone.id for zone in zones] == [1, 3]
+        assert fresh_vssl.get_zone(2) is None
+        assert fresh_vssl.get_zone(3).host == "192.168.168.12"
+
+    async def test_disconnect_zones_concurrently(self, fresh_vssl, monkeypatch):
+        active = []
+        peak = []
+
+        async def disconnect(zone):
+            active.append(zone)
+            peak.append(len(active))
+            await asyncio.sleep(0)
+            active.remove(zone)
+
+        monkeypatch.setattr(Zone, "disconnect", disconnect)
+
+        fresh_vssl.add_zones(["192.168.168.10", "192.168.168.11"])
+        await fresh_vssl.disconnect()
+
+        assert max(peak) == 2
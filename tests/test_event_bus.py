@@ -13,17 +13,19 @@ class TestEventBus:
         bus.stop()  # Ensure the event bus is stopped after each test
 
 
-    @pytest.mark.asyncio
     async def test_event_bus(self, event_bus):
         # Instantiate the EventBus
         #event_bus = EventBus()
 
         async def publish_with_entity(self, entity = None):
 
+            done = asyncio.Event()
+
             # Define a callback function to be subscribed to the event
             async def callback(data, *args, **kwargs):
                 callback.called = True
                 callback.data = data
+                done.set()
 
             # Subscribe the callback function to the event
             event_type = "test_event"
@@ -31,6 +33,7 @@ class TestEventBus:
             assert event_bus.subscribers.get(event_type) is not None
             assert len(event_bus.subscribers.get(event_type)) == 1
             assert event_bus.subscribers.get(event_type)[0][0] == callback
+            assert event_bus.subscribers.get(event_type)[0].entity == entity
 
 
             try:
@@ -38,8 +41,8 @@ class TestEventBus:
                 event_data = "test_data"
                 event_bus.publish(event_type, data=event_data, entity=entity)
 
-                # Wait for a short time to allow the event to be processed
-                await asyncio.sleep(0.1)
+                # Wait for the callback to be called
+                await asyncio.wait_for(done.wait(), 1.0)
 
                 # Assert that the callback function has been called
                 assert hasattr(callback, 'called') and callback.called is True
@@ -55,7 +58,6 @@ class TestEventBus:
         await publish_with_entity(1)
         await publish_with_entity('tet')
 
-    @pytest.mark.asyncio
     async def test_event_bus_future(self, event_bus):
 
         # Subscribe the callback function to the event
@@ -63,8 +65,80 @@ class TestEventBus:
         future = event_bus.future(event_type, 1)
         event_data = "test_data"
         event_bus.publish(event_type, data=event_data, entity=1)
-        data = await future
+        data = await asyncio.wait_for(future, 1.0)
         assert data == event_data
-        assert len(event_bus.subscribers.get(event_type)) == 0
+        assert event_type not in event_bus.subscribers
+
+    async def test_event_bus_future_entity(self, event_bus):
+        event_type = "test_event"
+        future_1 = event_bus.future(event_type, 1)
+        future_2 = event_bus.future(event_type, 2)
+
+        # Only the future for the published entity is resolved
+        event_bus.publish(event_type, data="test_data", entity=2)
+        assert await asyncio.wait_for(future_2, 1.0) == "test_data"
+        assert not future_1.done()
+
+        # A timed out future is cancelled and forgotten
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(future_1, 0.01)
+        assert future_1.cancelled()
+        assert 1 not in event_bus._futures[event_type]
+
+        event_bus.publish(event_type, data="test_data", entity=1)
+        await event_bus.join()
+
+    async def test_event_bus_callback_exception(self, event_bus):
+        event_type = "test_event"
+        received = []
+
+        async def failing_callback(data, *args, **kwargs):
+            raise ValueError("test_error")
+
+        async def callback(data, *args, **kwargs):
+            received.append(data)
+
+        event_bus.subscribe(event_type, failing_callback)
+        event_bus.subscribe(event_type, callback)
+
+        event_bus.publish(event_type, data="test_data", entity=1)
+        await event_bus.join()
+
+        # A failing subscriber must not stop the others receiving the event
+        assert received == ["test_data"]
+
+    async def test_event_bus_stop(self, event_bus):
+        event_bus.publish("test_event", data="test_data", entity=1)
+
+        # Stopping discards queued events and can be called again by the fixture
+        event_bus.stop()
+        event_bus.stop()
+
+        await asyncio.wait_for(event_bus.join(), 1.0)
+        assert event_bus.event_queue.empty()
+
+    async def test_event_bus_wait_future_timeout(self, event_bus):
+        future = event_bus.future("test_event", 1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await event_bus.wait_future(future, 0.01)
+
+        assert future.cancelled()
+
+    async def test_event_bus_stream(self, event_bus):
+        queue = event_bus.stream("test_event", 1)
+
+        event_bus.publish("test_event", 1, "first")
+        event_bus.publish("test_event", 2, "other")
+        event_bus.publish("test_event", 1, "second")
+        await asyncio.wait_for(event_bus.join(), 1.0)
+
+        assert queue.get_nowait() == "first"
+        assert queue.get_nowait() == "second"
+        assert queue.empty()
 
+        event_bus.close_stream("test_event", queue)
+        event_bus.publish("test_event", 1, "closed")
+        await asyncio.wait_for(event_bus.join(), 1.0)
 
+        assert queue.empty()
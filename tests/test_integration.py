@@ -1,21 +1,24 @@
-import time
 import asyncio
-import random
+import itertools
+from contextlib import asynccontextmanager
 import pytest
 import pytest_asyncio
 
-import vsslctrl as vssl_module
-from vsslctrl.core import Vssl
 from vsslctrl.zone import Zone
 from vsslctrl.transport import ZoneTransport
 from vsslctrl.group import ZoneGroup
 from vsslctrl.io import AnalogOutput, InputRouter, AnalogInput
 from vsslctrl.settings import ZoneSettings, VolumeSettings, EQSettings, VsslSettings, VsslPowerSettings
+from vsslctrl.utils import wait_with_timeout
 
 
-
+# Upper bound for any single wait, the per-test timeouts are derived from the
+# round-trip time measured while setting up the zone
 FUTURE_TIMEOUT = 5
 
+# Unique test names, time.time() repeats when tests finish within the same second
+_name_counter = itertools.count()
+
 # Mark all tests in this module with the pytest custom "integration" marker so
 # they can be selected or deselected as a whole, eg:
 # py.test -m "integration"
@@ -24,414 +27,328 @@ FUTURE_TIMEOUT = 5
 pytestmark = pytest.mark.integration
 
 
-@pytest_asyncio.fixture(scope="session")
-async def zone(request):
-
-
-    ip = request.config.option.ip
-    if ip is None:
-        pytest.fail("No ip address specified. Use the --ip option.")
-
-    zone = request.config.option.zone
-    if zone is None:
-        pytest.fail("No Zone specified. Use the --zone option.")
+@pytest.fixture(scope="session")
+def zone(live_zone):
+    return live_zone
 
-    vssl_instance = vssl_module.Vssl()
-    zone_instance = vssl_instance.add_zone(zone, ip)
-
-    asyncio.create_task(vssl_instance.initialise())
-
-    try:
-        await asyncio.wait_for(zone_instance.initialisation.wait(), 3)
-    except asyncio.TimeoutError:
-        pytest.fail(f"Couldnt connect to Zone at {ip}, not initialised")
-        
-
-    if not zone_instance.transport.is_playing or zone_instance.input.source != InputRouter.Sources.STREAM:
-        pytest.fail(
-            "Integration tests on the VSSL class must be run "
-            "with the VSSL zone playing a stream (not analog input)"
-        )
 
+@pytest.fixture(scope="session")
+def timeout(rtt):
+    return min(FUTURE_TIMEOUT, max(0.5, rtt * 20))
 
-    original_volume = zone_instance.volume
 
-    future_vol = vssl_instance.event_bus.future(Zone.Events.VOLUME_CHANGE, zone_instance.id)
-    zone_instance.volume = 50
-    await vssl_instance.event_bus.wait_future(future_vol, FUTURE_TIMEOUT)
+# Group changes take the device noticeably longer to confirm
+@pytest.fixture(scope="session")
+def slow_timeout(rtt):
+    return min(FUTURE_TIMEOUT + 2, max(1.0, rtt * 40))
 
-    # Yield the device to the test function
-    yield zone_instance
 
-    future_vol = vssl_instance.event_bus.future(Zone.Events.VOLUME_CHANGE, zone_instance.id)
-    zone_instance.volume = original_volume
-    await vssl_instance.event_bus.wait_future(future_vol, FUTURE_TIMEOUT)
+#
+# Set owner.attr to desired, only waiting on the change event when the value
+# is actually different
+#
+async def ensure_state(eb, owner, attr: str, event: str, entity: int, desired, timeout: float):
+    if getattr(owner, attr) == desired:
+        return
+    future_state = eb.future(event, entity)
+    setattr(owner, attr, desired)
+    assert await eb.wait_future(future_state, timeout) == desired
 
-    # Tear down. Restore state
-    await vssl_instance.disconnect()
 
+#
+# Set owner.attr to value for the body of the block, restoring the original
+# value on exit
+#
+@asynccontextmanager
+async def temporarily(eb, owner, attr: str, value, event: str, entity: int, timeout: float):
+    original = getattr(owner, attr)
 
-@pytest_asyncio.fixture(scope="session")
-async def eb(zone):
-    return zone.vssl.event_bus
+    future_state = eb.future(event, entity)
+    setattr(owner, attr, value)
+    assert await eb.wait_future(future_state, timeout) == value
 
-@pytest_asyncio.fixture(scope="session")
-async def vssl(zone):
-    return zone.vssl
-
-class TestVssl:
+    try:
+        yield original
+    finally:
+        await ensure_state(eb, owner, attr, event, entity, original, timeout)
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_name_change(self, zone, eb, vssl):
 
-        original_name = vssl.settings.name
-        test_name = str(int(time.time()))
-        
-        future_name = eb.future(VsslSettings.Events.NAME_CHANGE, 0)
+@pytest_asyncio.fixture
+async def muted_zone(zone, eb, timeout):
+    await ensure_state(eb, zone, "mute", Zone.Events.MUTE_CHANGE, zone.id, True, timeout)
+    return zone
 
-        vssl.settings.name = test_name
-        assert await eb.wait_future(future_name, FUTURE_TIMEOUT) == test_name
-        assert vssl.settings.name == test_name
 
-        future_name = eb.future(VsslSettings.Events.NAME_CHANGE, 0)
+@pytest_asyncio.fixture
+async def unmuted_zone(zone, eb, timeout):
+    await ensure_state(eb, zone, "mute", Zone.Events.MUTE_CHANGE, zone.id, False, timeout)
+    return zone
 
-        vssl.settings.name = original_name
-        assert await eb.wait_future(future_name, FUTURE_TIMEOUT) == original_name
-        assert vssl.settings.name == original_name
 
+#
+# Name round-trips: (owner of the name, attribute, event, uses zone id)
+#
+NAME_TARGETS = {
+    "vssl": (lambda zone: zone.vssl.settings, "name", VsslSettings.Events.NAME_CHANGE, False),
+    "optical_input": (lambda zone: zone.vssl.settings, "optical_input_name", VsslSettings.Events.OPTICAL_INPUT_NAME_CHANGE, False),
+    "zone": (lambda zone: zone.settings, "name", ZoneSettings.Events.NAME_CHANGE, True),
+    "analog_input": (lambda zone: zone.settings.analog_input, "name", AnalogInput.Events.NAME_CHANGE, True),
+}
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_optical_input_name_change(self, zone, eb, vssl):
 
-        original_name = vssl.settings.optical_input_name
-        test_name = str(int(time.time()))
+@pytest.mark.xdist_group(name="global")
+class TestNames:
 
-        future_name = eb.future(VsslSettings.Events.OPTICAL_INPUT_NAME_CHANGE, 0)
+    @pytest.mark.parametrize("target", NAME_TARGETS)
+    async def test_name_change(self, zone, eb, timeout, target):
+        get_owner, attr, event, zoned = NAME_TARGETS[target]
+        owner = get_owner(zone)
+        entity = zone.id if zoned else 0
 
-        vssl.settings.optical_input_name = test_name
-        assert await  eb.wait_future(future_name, FUTURE_TIMEOUT) == test_name
-        assert vssl.settings.optical_input_name == test_name
+        original_name = getattr(owner, attr)
+        test_name = f"vssltest-{next(_name_counter)}"
+        if test_name == original_name:
+            test_name = f"vssltest-{next(_name_counter)}"
 
-        future_name = eb.future(VsslSettings.Events.OPTICAL_INPUT_NAME_CHANGE, 0)
+        async with temporarily(eb, owner, attr, test_name, event, entity, timeout):
+            assert getattr(owner, attr) == test_name
 
-        vssl.settings.optical_input_name = original_name
-        assert await  eb.wait_future(future_name, FUTURE_TIMEOUT) == original_name
-        assert vssl.settings.optical_input_name == original_name
+        assert getattr(owner, attr) == original_name
 
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_power_adaptive_change(self, zone, eb, vssl):
+@pytest.mark.xdist_group(name="global")
+class TestVssl:
 
-        original_state = vssl.settings.power.adaptive
+    async def test_power_adaptive_change(self, zone, eb, timeout, vssl):
 
-        if original_state != True:
-            future_state = eb.future(VsslPowerSettings.Events.ADAPTIVE_CHANGE, 0)
-            vssl.settings.power.adaptive = True
-            await eb.wait_future(future_state, FUTURE_TIMEOUT)
-            assert vssl.settings.power.adaptive == True
+        power = vssl.settings.power
+        event = VsslPowerSettings.Events.ADAPTIVE_CHANGE
+        original_state = power.adaptive
 
-        future_state = eb.future(VsslPowerSettings.Events.ADAPTIVE_CHANGE, 0)
-        vssl.settings.power.adaptive_toggle()
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == False
-        assert vssl.settings.power.adaptive == False
+        await ensure_state(eb, power, "adaptive", event, 0, True, timeout)
 
-        if original_state != False:
-            future_state = eb.future(VsslPowerSettings.Events.ADAPTIVE_CHANGE, 0)
-            vssl.settings.power.adaptive = True
-            await eb.wait_future(future_state, FUTURE_TIMEOUT)
-            assert vssl.settings.power.adaptive == True
+        future_state = eb.future(event, 0)
+        power.adaptive_toggle()
+        assert await eb.wait_future(future_state, timeout) == False
 
-        assert vssl.settings.power.adaptive == original_state
+        await ensure_state(eb, power, "adaptive", event, 0, original_state, timeout)
 
- 
 
+@pytest.mark.xdist_group(name="volume")
 class TestVolume:
     """Integration tests for the volume property."""
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_valid_volumes(self, zone, eb):
-        random_vol = random.randint(15, 25) #less than whats set when setting up zone
-        future_vol = eb.future(Zone.Events.VOLUME_CHANGE, zone.id)
-        zone.volume = random_vol
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == random_vol
-        assert zone.volume == random_vol
+    @pytest.mark.parametrize("vols", [[15, 20, 25]]) #less than whats set when setting up zone
+    async def test_valid_volumes(self, zone, eb, timeout, vols):
+        # Futures for the same event all resolve on the first change, so
+        # stream the changes to check each of the pipelined sets
+        volumes = eb.stream(Zone.Events.VOLUME_CHANGE, zone.id)
+
+        try:
+            for vol in vols:
+                zone.volume = vol
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_mute_unmute(self, zone, eb):
+            async def changes():
+                return [await volumes.get() for _ in vols]
 
-        if zone.mute == True:
-            future_state = eb.future(Zone.Events.MUTE_CHANGE, zone.id)
-            zone.mute = False
-            assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == False
+            assert await wait_with_timeout(changes(), timeout * len(vols)) == vols
+        finally:
+            eb.close_stream(Zone.Events.VOLUME_CHANGE, volumes)
+
+    async def test_mute_unmute(self, unmuted_zone, eb, timeout):
+        zone = unmuted_zone
 
         future_state = eb.future(Zone.Events.MUTE_CHANGE, zone.id)
         zone.mute_toggle()
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == True
-        assert zone.mute == True
+        assert await eb.wait_future(future_state, timeout) == True
 
         future_state = eb.future(Zone.Events.MUTE_CHANGE, zone.id)
         zone.mute = False
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == False
+        assert await eb.wait_future(future_state, timeout) == False
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_unmute_when_volume_changed(self, zone, eb):
+    async def test_unmute_when_volume_changed(self, muted_zone, eb, timeout):
+        zone = muted_zone
         original_vol = zone.volume
 
-        if zone.mute == False:
-            future_state = eb.future(Zone.Events.MUTE_CHANGE, zone.id)
-            zone.mute = True
-            assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == True
-
         """
-            Volume wont unmute if the volume is 
+            Volume wont unmute if the volume is
             set to the same as value as before muting
-        """ 
+        """
         future_state = eb.future(Zone.Events.MUTE_CHANGE, zone.id)
         future_vol = eb.future(Zone.Events.VOLUME_CHANGE, zone.id)
 
         zone.volume = original_vol + 2
 
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == False
-        assert zone.mute == False
+        assert await eb.wait_future(future_state, timeout) == False
 
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == (original_vol + 2)
-        assert zone.volume == (original_vol + 2)
+        assert await eb.wait_future(future_vol, timeout) == (original_vol + 2)
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_volume_raise_lower(self, zone, eb):
+    async def test_volume_raise_lower(self, zone, eb, timeout):
         original_vol = zone.volume
+        volumes = eb.stream(Zone.Events.VOLUME_CHANGE, zone.id)
 
-        future_vol = eb.future(Zone.Events.VOLUME_CHANGE, zone.id)
-        zone.volume_raise()
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == original_vol + 1
-        assert zone.volume == original_vol + 1
+        try:
+            zone.volume_raise()
+            assert await wait_with_timeout(volumes.get(), timeout) == original_vol + 1
 
-        future_vol = eb.future(Zone.Events.VOLUME_CHANGE, zone.id)
-        zone.volume_lower()
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == original_vol
-        assert zone.volume == original_vol
+            zone.volume_lower()
+            assert await wait_with_timeout(volumes.get(), timeout) == original_vol
 
-        future_vol = eb.future(Zone.Events.VOLUME_CHANGE, zone.id)
-        zone.volume_lower(5)
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == original_vol - 5
-        assert zone.volume == original_vol - 5
+            zone.volume_lower(5)
+            assert await wait_with_timeout(volumes.get(), timeout) == original_vol - 5
 
-        future_vol = eb.future(Zone.Events.VOLUME_CHANGE, zone.id)
-        zone.volume_raise(5)
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == original_vol
-        assert zone.volume == original_vol
+            zone.volume_raise(5)
+            assert await wait_with_timeout(volumes.get(), timeout) == original_vol
+        finally:
+            eb.close_stream(Zone.Events.VOLUME_CHANGE, volumes)
 
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_invalid_volume_will_be_clamped(self, zone, eb):
+    async def test_invalid_volume_will_be_clamped(self, zone, eb, timeout):
         future_vol = eb.future(Zone.Events.VOLUME_CHANGE, zone.id)
         zone.volume = -5
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == 0
-        assert zone.volume == 0
+        assert await eb.wait_future(future_vol, timeout) == 0
 
+
+@pytest.mark.xdist_group(name="global")
 class TestGroup:
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_group_is_master(self, zone, eb):
+    async def test_group_is_master(self, zone, eb, timeout, slow_timeout, group_member):
         assert isinstance(zone.group.index, int)
         assert zone.group.index != zone.id
         assert zone.group.index != 0
         assert zone.group.is_master == False
 
         future_state = eb.future(ZoneGroup.Events.IS_MASTER_CHANGE, zone.id)
-        zone.group.add_member(3)
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == True
-        assert zone.group.is_master == True
+        zone.group.add_member(group_member)
+        assert await eb.wait_future(future_state, timeout) == True
 
         future_state = eb.future(ZoneGroup.Events.IS_MASTER_CHANGE, zone.id)
-        zone.group.remove_member(3)
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT + 2) == False
-        assert zone.group.is_master == False
+        zone.group.remove_member(group_member)
+        assert await eb.wait_future(future_state, slow_timeout) == False
 
         # Add again so we can check dissolve
         future_state = eb.future(ZoneGroup.Events.IS_MASTER_CHANGE, zone.id)
-        zone.group.add_member(3)
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == True
-        assert zone.group.is_master == True
+        zone.group.add_member(group_member)
+        assert await eb.wait_future(future_state, timeout) == True
 
         future_state = eb.future(ZoneGroup.Events.IS_MASTER_CHANGE, zone.id)
         zone.group.dissolve()
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == False
-        assert zone.group.is_master == False
+        assert await eb.wait_future(future_state, timeout) == False
+
 
+@pytest.mark.xdist_group(name="global")
 class TestInputRouter:
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_source_change(self, zone, eb):
+    async def test_source_change(self, zone, eb, timeout):
 
         original_source = zone.input.source
 
-        if original_source != InputRouter.Sources.STREAM:
-            future_source = eb.future(InputRouter.Events.SOURCE_CHANGE, zone.id)
-            zone.input.source = InputRouter.Sources.STREAM
-            assert await eb.wait_future(future_source, FUTURE_TIMEOUT) == InputRouter.Sources.STREAM
-            assert zone.input.source == InputRouter.Sources.STREAM
+        await ensure_state(
+            eb, zone.input, "source", InputRouter.Events.SOURCE_CHANGE, zone.id,
+            InputRouter.Sources.STREAM, timeout
+        )
 
         # Optical
         future_source = eb.future(InputRouter.Events.SOURCE_CHANGE, zone.id)
         zone.input.source = InputRouter.Sources.OPTICAL_IN
-        assert await eb.wait_future(future_source, FUTURE_TIMEOUT) == InputRouter.Sources.OPTICAL_IN
-        assert zone.input.source == InputRouter.Sources.OPTICAL_IN
+        assert await eb.wait_future(future_source, timeout) == InputRouter.Sources.OPTICAL_IN
 
         # AI 1
         future_source = eb.future(InputRouter.Events.SOURCE_CHANGE, zone.id)
         zone.input.source = InputRouter.Sources.ANALOG_IN_1
-        assert await eb.wait_future(future_source, FUTURE_TIMEOUT) == InputRouter.Sources.ANALOG_IN_1
-        assert zone.input.source == InputRouter.Sources.ANALOG_IN_1
+        assert await eb.wait_future(future_source, timeout) == InputRouter.Sources.ANALOG_IN_1
 
         #Back to original source
         future_source = eb.future(InputRouter.Events.SOURCE_CHANGE, zone.id)
         zone.input.source = original_source
-        assert await eb.wait_future(future_source, FUTURE_TIMEOUT) == original_source
-        assert zone.input.source == original_source
+        assert await eb.wait_future(future_source, timeout) == original_source
 
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_priority_change(self, zone, eb):
+    async def test_priority_change(self, zone, eb, timeout):
 
         oringal_router_priority = zone.input.priority
 
-        if zone.input.priority != InputRouter.Priorities.STREAM:
-            future_priority = eb.future(InputRouter.Events.PRIORITY_CHANGE, zone.id)
-            zone.input.priority = InputRouter.Priorities.STREAM
-            assert await eb.wait_future(future_priority, FUTURE_TIMEOUT) == InputRouter.Priorities.STREAM
-            assert zone.input.priority == InputRouter.Priorities.STREAM
+        await ensure_state(
+            eb, zone.input, "priority", InputRouter.Events.PRIORITY_CHANGE, zone.id,
+            InputRouter.Priorities.STREAM, timeout
+        )
 
         future_priority = eb.future(InputRouter.Events.PRIORITY_CHANGE, zone.id)
         zone.input.priority = InputRouter.Priorities.LOCAL
-        assert await eb.wait_future(future_priority, FUTURE_TIMEOUT) == InputRouter.Priorities.LOCAL
-        assert zone.input.priority == InputRouter.Priorities.LOCAL
-
-        if zone.input.priority != oringal_router_priority:
-            future_priority = eb.future(InputRouter.Events.PRIORITY_CHANGE, zone.id)
-            zone.input.priority = oringal_router_priority
-            assert await eb.wait_future(future_priority, FUTURE_TIMEOUT) == oringal_router_priority
-            assert zone.input.priority == oringal_router_priority
+        assert await eb.wait_future(future_priority, timeout) == InputRouter.Priorities.LOCAL
+
+        await ensure_state(
+            eb, zone.input, "priority", InputRouter.Events.PRIORITY_CHANGE, zone.id,
+            oringal_router_priority, timeout
+        )
+
+
+@pytest.mark.xdist_group(name="io")
 class TestAnalogOutput:
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_source_change(self, zone, eb):
+    async def test_source_change(self, zone, eb, timeout):
 
         original_source = zone.analog_output.source
 
-        if original_source != AnalogOutput.Sources.OFF:
-            future_source = eb.future(AnalogOutput.Events.SOURCE_CHANGE, zone.id)
-            zone.analog_output.source = AnalogOutput.Sources.OFF
-            assert await eb.wait_future(future_source, FUTURE_TIMEOUT) == AnalogOutput.Sources.OFF
-            assert zone.analog_output.source == AnalogOutput.Sources.OFF
+        await ensure_state(
+            eb, zone.analog_output, "source", AnalogOutput.Events.SOURCE_CHANGE, zone.id,
+            AnalogOutput.Sources.OFF, timeout
+        )
 
         future_source = eb.future(AnalogOutput.Events.SOURCE_CHANGE, zone.id)
         zone.analog_output.source = AnalogOutput.Sources.ZONE_1
-        assert await eb.wait_future(future_source, FUTURE_TIMEOUT) == AnalogOutput.Sources.ZONE_1
-        assert zone.analog_output.source == AnalogOutput.Sources.ZONE_1
+        assert await eb.wait_future(future_source, timeout) == AnalogOutput.Sources.ZONE_1
 
         future_source = eb.future(AnalogOutput.Events.SOURCE_CHANGE, zone.id)
         zone.analog_output.source = AnalogOutput.Sources.OPTICAL_IN
-        assert await eb.wait_future(future_source, FUTURE_TIMEOUT) == AnalogOutput.Sources.OPTICAL_IN
-        assert zone.analog_output.source == AnalogOutput.Sources.OPTICAL_IN
+        assert await eb.wait_future(future_source, timeout) == AnalogOutput.Sources.OPTICAL_IN
 
-        if zone.analog_output.source != original_source:
-            future_source = eb.future(AnalogOutput.Events.SOURCE_CHANGE, zone.id)
-            zone.analog_output.source = original_source
-            assert await eb.wait_future(future_source, FUTURE_TIMEOUT) == original_source
-            assert zone.analog_output.source == original_source
+        await ensure_state(
+            eb, zone.analog_output, "source", AnalogOutput.Events.SOURCE_CHANGE, zone.id,
+            original_source, timeout
+        )
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_is_fixed_volume(self, zone, eb):
+    async def test_is_fixed_volume(self, zone, eb, timeout):
 
         original_state = zone.analog_output.is_fixed_volume
-        
+
         assert isinstance(original_state, bool)
 
         new_state = not original_state
 
         future_state = eb.future(AnalogOutput.Events.IS_FIXED_VOLUME_CHANGE, zone.id)
         zone.analog_output.is_fixed_volume = new_state
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == new_state
-        assert zone.analog_output.is_fixed_volume == new_state
+        assert await eb.wait_future(future_state, timeout) == new_state
 
 
         future_state = eb.future(AnalogOutput.Events.IS_FIXED_VOLUME_CHANGE, zone.id)
         zone.analog_output.is_fixed_volume_toggle()
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == original_state
-        assert zone.analog_output.is_fixed_volume == original_state
-class TestVolumeSettings:
-
-    @pytest.mark.asyncio(scope="session")
-    async def test_vol_setting_default_on(self, zone, eb):
-
-        original_vol = zone.settings.volume.default_on
-        test_vol = 50 if original_vol != 50 else 40
-
-        future_vol = eb.future(VolumeSettings.Events.DEFAULT_ON_CHANGE, zone.id)
-        zone.settings.volume.default_on = test_vol
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == test_vol
-        assert zone.settings.volume.default_on == test_vol
-
-        future_vol = eb.future(VolumeSettings.Events.DEFAULT_ON_CHANGE, zone.id)
-        zone.settings.volume.default_on = original_vol
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == original_vol
-        assert zone.settings.volume.default_on == original_vol
-
-
-    @pytest.mark.asyncio(scope="session")
-    async def test_vol_setting_max_left(self, zone, eb):
-
-        original_vol = zone.settings.volume.max_left
-        test_vol = 50 if original_vol != 50 else 40
+        assert await eb.wait_future(future_state, timeout) == original_state
 
-        future_vol = eb.future(VolumeSettings.Events.MAX_LEFT_CHANGE, zone.id)
-        zone.settings.volume.max_left = test_vol
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == test_vol
-        assert zone.settings.volume.max_left == test_vol
 
-        future_vol = eb.future(VolumeSettings.Events.MAX_LEFT_CHANGE, zone.id)
-        zone.settings.volume.max_left = original_vol
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == original_vol
-        assert zone.settings.volume.max_left == original_vol
-
-    @pytest.mark.asyncio(scope="session")
-    async def test_vol_setting_max_right(self, zone, eb):
+@pytest.mark.xdist_group(name="volume")
+class TestVolumeSettings:
 
-        original_vol = zone.settings.volume.max_right
-        test_vol = 50 if original_vol != 50 else 40
+    @pytest.mark.parametrize(
+        "attr, event",
+        [
+            ("default_on", VolumeSettings.Events.DEFAULT_ON_CHANGE),
+            ("max_left", VolumeSettings.Events.MAX_LEFT_CHANGE),
+            ("max_right", VolumeSettings.Events.MAX_RIGHT_CHANGE),
+        ],
+    )
+    async def test_vol_setting(self, zone, eb, timeout, attr, event):
+        volume = zone.settings.volume
+        test_vol = 50 if getattr(volume, attr) != 50 else 40
 
-        future_vol = eb.future(VolumeSettings.Events.MAX_RIGHT_CHANGE, zone.id)
-        zone.settings.volume.max_right = test_vol
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == test_vol
-        assert zone.settings.volume.max_right == test_vol
+        async with temporarily(eb, volume, attr, test_vol, event, zone.id, timeout):
+            assert getattr(volume, attr) == test_vol
 
-        future_vol = eb.future(VolumeSettings.Events.MAX_RIGHT_CHANGE, zone.id)
-        zone.settings.volume.max_right = original_vol
-        assert await eb.wait_future(future_vol, FUTURE_TIMEOUT) == original_vol
-        assert zone.settings.volume.max_right == original_vol
 
+@pytest.mark.xdist_group(name="io")
 class TestAnalogInput:
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_name_change(self, zone, eb):
-
-        original_name = zone.settings.analog_input.name
-        test_name = str(int(time.time()))
-        
-        future_name = eb.future(AnalogInput.Events.NAME_CHANGE, zone.id)
-        zone.settings.analog_input.name = test_name
-        assert await eb.wait_future(future_name, FUTURE_TIMEOUT) == test_name
-        assert zone.settings.analog_input.name == test_name
-
-        future_name = eb.future(AnalogInput.Events.NAME_CHANGE, zone.id)
-        zone.settings.analog_input.name = original_name
-        assert await eb.wait_future(future_name, FUTURE_TIMEOUT) == original_name
-        assert zone.settings.analog_input.name == original_name
- 
-
-    @pytest.mark.asyncio(scope="session")
-    async def test_fixed_gain(self, zone, eb):
+    async def test_fixed_gain(self, zone, eb, timeout):
 
         original_gain = zone.settings.analog_input.fixed_gain
 
@@ -441,167 +358,142 @@ class TestAnalogInput:
             assert zone.settings.analog_input.has_fixed_gain == True
             future_gain = eb.future(AnalogInput.Events.FIXED_GAIN_CHANGE, zone.id)
             zone.settings.analog_input.fixed_gain = 0
-            assert await eb.wait_future(future_gain, FUTURE_TIMEOUT) == 0
+            assert await eb.wait_future(future_gain, timeout) == 0
             assert zone.settings.analog_input.has_fixed_gain == False
 
         future_gain = eb.future(AnalogInput.Events.FIXED_GAIN_CHANGE, zone.id)
         zone.settings.analog_input.fixed_gain = 52
-        assert await eb.wait_future(future_gain, FUTURE_TIMEOUT) == 52
-        assert zone.settings.analog_input.fixed_gain == 52
+        assert await eb.wait_future(future_gain, timeout) == 52
         assert zone.settings.analog_input.has_fixed_gain == True
 
         #Check clamped
         future_gain = eb.future(AnalogInput.Events.FIXED_GAIN_CHANGE, zone.id)
         zone.settings.analog_input.fixed_gain = 120
-        assert await eb.wait_future(future_gain, FUTURE_TIMEOUT) == 100
-        assert zone.settings.analog_input.fixed_gain == 100
+        assert await eb.wait_future(future_gain, timeout) == 100
         assert zone.settings.analog_input.has_fixed_gain == True
 
         if zone.settings.analog_input.fixed_gain != original_gain:
             future_gain = eb.future(AnalogInput.Events.FIXED_GAIN_CHANGE, zone.id)
             zone.settings.analog_input.fixed_gain = original_gain
-            assert await eb.wait_future(future_gain, FUTURE_TIMEOUT) == original_gain
-            assert zone.settings.analog_input.fixed_gain == original_gain
-
-class TestZoneSettings:
-
-    @pytest.mark.asyncio(scope="session")
-    async def test_name_change(self, zone, eb):
+            assert await eb.wait_future(future_gain, timeout) == original_gain
 
-        original_name = zone.settings.name
-        test_name = str(int(time.time()))
-        
-        future_name = eb.future(ZoneSettings.Events.NAME_CHANGE, zone.id)
-        zone.settings.name = test_name
-        assert await eb.wait_future(future_name, FUTURE_TIMEOUT) == test_name
-        assert zone.settings.name == test_name
-
-        future_name = eb.future(ZoneSettings.Events.NAME_CHANGE, zone.id)
-        zone.settings.name = original_name
-        assert await eb.wait_future(future_name, FUTURE_TIMEOUT) == original_name
-        assert zone.settings.name == original_name
 
+@pytest.mark.xdist_group(name="settings")
+class TestZoneSettings:
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_stereo_mono(self, zone, eb):
+    async def test_stereo_mono(self, zone, eb, timeout):
 
         original_state = zone.settings.mono
-        
+
         assert isinstance(original_state, ZoneSettings.StereoMono)
 
         new_state = not original_state
 
         future_state = eb.future(ZoneSettings.Events.MONO_CHANGE, zone.id)
         zone.settings.mono = new_state
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == new_state
-        assert zone.settings.mono == new_state
+        assert await eb.wait_future(future_state, timeout) == new_state
 
 
         future_state = eb.future(ZoneSettings.Events.MONO_CHANGE, zone.id)
         zone.settings.mono_toggle()
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == original_state
-        assert zone.settings.mono == original_state
-
-
+        assert await eb.wait_future(future_state, timeout) == original_state
 
 
+@pytest.mark.xdist_group(name="settings")
 class TestEQSettings:
-    @pytest.mark.asyncio(scope="session")
-    async def test_settings_eq_enable(self, zone, eb):
+    async def test_settings_eq_enable(self, zone, eb, timeout):
+        eq = zone.settings.eq
+        event = EQSettings.Events.ENABLED_CHANGE
 
-        original_state = zone.settings.eq.enabled
+        original_state = eq.enabled
 
         assert isinstance(original_state, bool)
 
         new_state = not original_state
 
-        future_state = eb.future(EQSettings.Events.ENABLED_CHANGE, zone.id)
-        zone.settings.eq.enabled = new_state
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == new_state
-        assert zone.settings.eq.enabled == new_state
+        future_state = eb.future(event, zone.id)
+        eq.enabled = new_state
+        assert await eb.wait_future(future_state, timeout) == new_state
+
 
+        future_state = eb.future(event, zone.id)
+        eq.enabled_toggle()
+        assert await eb.wait_future(future_state, timeout) == original_state
 
-        future_state = eb.future(EQSettings.Events.ENABLED_CHANGE, zone.id)
-        zone.settings.eq.enabled_toggle()
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == original_state
-        assert zone.settings.eq.enabled == original_state
 
+    async def test_settings_set_eq_freqs(self, zone, eb, timeout):
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_settings_set_eq_freqs(self, zone, eb):
+        eq = zone.settings.eq
+        events = EQSettings.Events
+        freqs = tuple(EQSettings.Freqs)
+        future = eb.future
+        wait_future = eb.wait_future
+        event_map = {freq: getattr(events, f'{freq.name}_CHANGE') for freq in freqs}
 
-        for freq in EQSettings.Freqs:
+        keys = {freq: freq.name.lower() for freq in freqs}
+        db_keys = {freq: f'{keys[freq]}_db' for freq in freqs}
+        # dB to the 90 - 110 value the device reports
+        from_db = {
+            db: eq._map_clamp(db, False)
+            for db in range(EQSettings.MIN_VALUE_DB, EQSettings.MAX_VALUE_DB + 1)
+        }
 
-            # Noraml Values
-            freq_key = freq.name.lower()
-            original_val = getattr(zone.settings.eq, freq_key)
-            test_val = 99 if original_val != 99 else 98
+        def snapshot(key_map: dict):
+            return {freq: getattr(eq, key_map[freq]) for freq in freqs}
 
-            future_val = eb.future(getattr(EQSettings.Events, f'{freq.name}_CHANGE'), zone.id)
-            setattr(zone.settings.eq, freq_key, test_val)
-            assert await eb.wait_future(future_val, FUTURE_TIMEOUT) == test_val
-            assert getattr(zone.settings.eq, freq_key) == test_val
+        #
+        # Set every frequency back-to-back then wait on all the change events
+        # together, rather than one round-trip per frequency
+        #
+        async def set_all(key_map: dict, values: dict):
+            futures = [future(event_map[freq], zone.id) for freq in freqs]
+            for freq in freqs:
+                setattr(eq, key_map[freq], values[freq])
+            results = await asyncio.gather(
+                *(wait_future(fut, timeout * len(futures)) for fut in futures)
+            )
+            return dict(zip(freqs, results))
 
-            future_val = eb.future(getattr(EQSettings.Events, f'{freq.name}_CHANGE'), zone.id)
-            setattr(zone.settings.eq, freq_key, original_val)
-            assert await eb.wait_future(future_val, FUTURE_TIMEOUT) == original_val
-            assert getattr(zone.settings.eq, freq_key) == original_val
+        # Noraml Values
+        originals = snapshot(keys)
+        tests = {freq: 98 if val == 99 else 99 for freq, val in originals.items()}
 
-            # DB Values
-            freq_key = f'{freq.name.lower()}_db'
-            original_val = getattr(zone.settings.eq, freq_key)
-            test_val = -7 if original_val != -7 else -6
+        for values in (tests, originals):
+            assert await set_all(keys, values) == values
 
-            future_val = eb.future(getattr(EQSettings.Events, f'{freq.name}_CHANGE'), zone.id)
-            setattr(zone.settings.eq, freq_key, test_val)
-            # Always returns value in 90 - 110 range
-            assert await eb.wait_future(future_val, FUTURE_TIMEOUT) == zone.settings.eq._map_clamp(test_val, False)
-            assert getattr(zone.settings.eq, freq_key) == test_val
+        # DB Values, always returned in the 90 - 110 range
+        originals = snapshot(db_keys)
+        tests = {freq: -6 if val == -7 else -7 for freq, val in originals.items()}
 
-            future_val = eb.future(getattr(EQSettings.Events, f'{freq.name}_CHANGE'), zone.id)
-            setattr(zone.settings.eq, freq_key, original_val)
-            # Always returns value in 90 - 110 range
-            assert await eb.wait_future(future_val, FUTURE_TIMEOUT) == zone.settings.eq._map_clamp(original_val, False)
-            assert getattr(zone.settings.eq, freq_key) == original_val
+        for values in (tests, originals):
+            mapped = {freq: from_db[val] for freq, val in values.items()}
+            assert await set_all(db_keys, values) == mapped
+            assert snapshot(db_keys) == values
 
+
+@pytest.mark.xdist_group(name="global")
 class TestTransport:
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_transport(self, zone, eb):
+    async def test_transport(self, zone, eb, timeout):
         assert zone.transport.state == ZoneTransport.States.PLAY
         assert zone.transport.is_playing
 
         future_state = eb.future(ZoneTransport.Events.STATE_CHANGE_PAUSE, zone.id)
         zone.transport.state = ZoneTransport.States.PAUSE
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == True
-        assert zone.transport.state == ZoneTransport.States.PAUSE
-        assert zone.transport.is_paused
+        assert await eb.wait_future(future_state, timeout) == True
 
         future_state = eb.future(ZoneTransport.Events.STATE_CHANGE_PLAY, zone.id)
         zone.transport.play()
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == True
-        assert zone.transport.is_playing
+        assert await eb.wait_future(future_state, timeout) == True
 
         future_state = eb.future(ZoneTransport.Events.STATE_CHANGE, zone.id)
         zone.pause()
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == ZoneTransport.States.PAUSE
-        assert zone.transport.is_paused
+        assert await eb.wait_future(future_state, timeout) == ZoneTransport.States.PAUSE
 
         future_state = eb.future(ZoneTransport.Events.STATE_CHANGE, zone.id)
         zone.play()
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == ZoneTransport.States.PLAY
-        assert zone.transport.is_playing
+        assert await eb.wait_future(future_state, timeout) == ZoneTransport.States.PLAY
 
         future_state = eb.future(ZoneTransport.Events.STATE_CHANGE, zone.id)
         zone.stop()
-        assert await eb.wait_future(future_state, FUTURE_TIMEOUT) == ZoneTransport.States.STOP
-        assert zone.transport.is_stopped
-
-
-
-
- 
-
-
-
-        
+        assert await eb.wait_future(future_state, timeout) == ZoneTransport.States.STOP
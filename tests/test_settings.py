@@ -20,75 +20,68 @@ from vsslctrl.settings import (
 from vsslctrl.utils import clamp_volume
 
 
-@pytest_asyncio.fixture(scope="session")
-async def zone(request):
-    vssl_instance = vssl_module.Vssl()
-    zone_instance = vssl_instance.add_zone(1, "192.168.168.1")
+@pytest.fixture(scope="session")
+def zone(mock_zone):
+    return mock_zone
 
-    # Yield the device to the test function
-    yield zone_instance
 
-    # Tear down. Restore state
-    await vssl_instance.disconnect()
+@pytest.fixture(scope="session")
+def eq_settings(zone):
+    return zone.settings.eq
 
 
-@pytest_asyncio.fixture(scope="session")
-async def eb(zone):
-    return zone.vssl.event_bus
+# Public key names and event names, reflected once at import
+_KEY_SETS = {
+    cls: (
+        frozenset(name for name in vars(cls.Keys) if not name.startswith("_")),
+        frozenset(vars(cls.Events)),
+    )
+    for cls in (VsslSettings, VolumeSettings, EQSettings)
+}
 
 
-@pytest_asyncio.fixture(scope="session")
-async def vssl(zone):
-    return zone.vssl
-
-
-def check_keys_have_events(keys_obj, events_obj):
+def check_keys_have_events(cls):
     # check keys have events
-    for attr_name in dir(keys_obj):
-        if not attr_name.startswith("__") and not attr_name.endswith("__"):
-            assert hasattr(events_obj, f"{attr_name}_CHANGE")
+    keys, events = _KEY_SETS[cls]
+    missing = {f"{name}_CHANGE" for name in keys} - events
+    assert not missing, missing
 
 
 class TestVsslSettings:
-    @pytest.mark.asyncio(scope="session")
-    async def test_keys_exist(self, zone, eb):
+    def test_keys_exist(self):
         # check keys have events
-        check_keys_have_events(VsslSettings.Keys, VsslSettings.Events)
+        check_keys_have_events(VsslSettings)
 
 
 class TestVolumeSettings:
-    @pytest.mark.asyncio(scope="session")
-    async def test_keys_exist(self, zone, eb):
+    def test_keys_exist(self):
         # check keys have events
-        check_keys_have_events(VolumeSettings.Keys, VolumeSettings.Events)
+        check_keys_have_events(VolumeSettings)
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_clamp(self, zone, eb):
+    def test_clamp(self):
         assert clamp_volume(110) == 100
         assert clamp_volume(-10) == 0
         assert clamp_volume(50) == 50
 
 
 class TestEQSettings:
-    @pytest.mark.asyncio(scope="session")
-    async def test_keys_exist(self, zone, eb):
+    def test_keys_exist(self):
         # Check freq have keys
-        for key, freq in enumerate(EQSettings.Freqs):
-            assert hasattr(EQSettings.Keys, freq.name)
+        keys, _ = _KEY_SETS[EQSettings]
+        missing = {freq.name for freq in EQSettings.Freqs} - keys
+        assert not missing, missing
 
         # check keys have events
-        check_keys_have_events(EQSettings.Keys, EQSettings.Events)
+        check_keys_have_events(EQSettings)
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_clamp(self, zone, eb):
-        eq = zone.settings.eq
+    def test_clamp(self, eq_settings):
+        eq = eq_settings
         # check values are correctly maped and clamped to VSSL requirements
         assert eq._clamp(eq.MIN_VALUE - 30) == eq.MIN_VALUE
         assert eq._clamp(eq.MAX_VALUE + 30) == eq.MAX_VALUE
 
-    @pytest.mark.asyncio(scope="session")
-    async def test_map_clamp(self, zone, eb):
-        eq = zone.settings.eq
+    def test_map_clamp(self, eq_settings):
+        eq = eq_settings
         # Test mapping to DB
         assert eq._map_clamp(eq.MIN_VALUE, True) == eq.MIN_VALUE_DB
         assert eq._map_clamp(eq.MAX_VALUE, True) == eq.MAX_VALUE_DB
@@ -99,16 +92,18 @@ class TestEQSettings:
         assert eq._map_clamp(95, True) == -5  # 5db
         assert eq._map_clamp(5, False) == 105
 
-    @pytest.mark.asyncio(scope="session")
     async def test_setting_eq_values(self, zone, eb):
         eq = zone.settings.eq
         test_values = [90, 96, 100, 105, 108]
 
+        event = EQSettings.Events.KHZ1_CHANGE
+        freq = EQSettings.Freqs.KHZ1
+        key = EQSettings.Keys.KHZ1
+        db_key = f"{key}_db"
+
         for test_val in test_values:
-            future_eq = eb.future(EQSettings.Events.KHZ1_CHANGE, zone.id)
-            eq._set_eq_freq(EQSettings.Freqs.KHZ1, test_val)
-            assert getattr(eq, EQSettings.Keys.KHZ1) == test_val
+            future_eq = eb.future(event, zone.id)
+            eq._set_eq_freq(freq, test_val)
+            assert getattr(eq, key) == test_val
             assert await future_eq == test_val
-            assert getattr(eq, f"{EQSettings.Keys.KHZ1}_db") == eq._map_clamp(
-                test_val, True
-            )
+            assert getattr(eq, db_key) == eq._map_clamp(test_val, True)
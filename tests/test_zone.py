@@ -1,58 +1,52 @@
-import time
-import asyncio
-import random
+import functools
 import pytest
-import pytest_asyncio
-
-import vsslctrl as vssl_module
-from vsslctrl.core import Vssl
-from vsslctrl.zone import Zone
-from vsslctrl.transport import ZoneTransport
-from vsslctrl.group import ZoneGroup
-from vsslctrl.io import AnalogOutput, InputRouter, AnalogInput
+
 from vsslctrl.track import TrackMetadata
-from vsslctrl.utils import clamp_volume
+from vsslctrl.api_alpha import APIAlpha
+from vsslctrl.api_bravo import APIBravo
+from vsslctrl.exceptions import ZoneConnectionError
 
 
-@pytest_asyncio.fixture(scope="session")
-async def zone(request):
-    vssl_instance = vssl_module.Vssl()
-    zone_instance = vssl_instance.add_zone(1, "192.168.168.1")
+# Public names and values of a Keys class, reflected once per class
+@functools.lru_cache(maxsize=None)
+def public_keys(keys_obj):
+    return {
+        name: value
+        for name, value in vars(keys_obj).items()
+        if not name.startswith("_")
+    }
 
-    # Yield the device to the test function
-    yield zone_instance
 
-    # Tear down. Restore state
-    await vssl_instance.disconnect()
+def check_keys(keys_obj, events_obj, defaults_obj):
+    # check keys have events and defaults
+    keys = public_keys(keys_obj)
 
+    missing_events = {f"{name}_CHANGE" for name in keys} - vars(events_obj).keys()
+    assert not missing_events, missing_events
 
-@pytest_asyncio.fixture(scope="session")
-async def eb(zone):
-    return zone.vssl.event_bus
+    missing_defaults = set(keys.values()) - defaults_obj.keys()
+    assert not missing_defaults, missing_defaults
 
 
-@pytest_asyncio.fixture(scope="session")
-async def vssl(zone):
-    return zone.vssl
+class TestTrackMetadata:
+    def test_keys_exist(self):
+        check_keys(TrackMetadata.Keys, TrackMetadata.Events, TrackMetadata.DEFAULTS)
 
 
-def check_keys_have_events(keys_obj, events_obj):
-    # check keys have events
-    for attr_name in dir(keys_obj):
-        if not attr_name.startswith("__") and not attr_name.endswith("__"):
-            assert hasattr(events_obj, f"{attr_name}_CHANGE")
+class TestZoneInitialise:
+    async def test_failed_connect_disconnects_other_api(self, fresh_zone, monkeypatch):
+        async def refused(api):
+            raise ZoneConnectionError("refused")
 
+        async def connected(api):
+            api._create_events()
+            api.connection_event.set()
+            return True
 
-def check_keys_have_default(keys_obj, defaults_obj):
-    # check keys have events
-    for attr_name in dir(keys_obj):
-        if not attr_name.startswith("__") and not attr_name.endswith("__"):
-            assert getattr(keys_obj, attr_name) in defaults_obj
+        monkeypatch.setattr(APIAlpha, "connect", refused)
+        monkeypatch.setattr(APIBravo, "connect", connected)
 
+        with pytest.raises(ZoneConnectionError):
+            await fresh_zone.initialise()
 
-class TestTrackMetadata:
-    @pytest.mark.asyncio(scope="session")
-    async def test_keys_exist(self, zone, eb):
-        # check keys have events
-        check_keys_have_events(TrackMetadata.Keys, TrackMetadata.Events)
-        check_keys_have_default(TrackMetadata.Keys, TrackMetadata.DEFAULTS)
+        assert not fresh_zone.api_bravo.connected
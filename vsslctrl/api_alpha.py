@@ -1,15 +1,15 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-import json
 import time
 import struct
+import asyncio
 import logging
 
 from .api_base import APIBase
 from .transport import ZoneTransport
 from .settings import EQSettings
 
-from .utils import hex_to_int, clamp_volume, hex_to_bytearray_string
+from .utils import clamp_volume, bytes_to_bytearray_string, json_loads
 from .decorators import logging_helpers
 from .data_structure import (
     ZoneStatusExtKeys,
@@ -19,6 +19,20 @@ from .data_structure import (
     DeviceStatusExtendedExtKeys,
 )
 
+# Length byte of variable length requests
+_LEN_B = struct.Struct(">B")
+
+
+# Status values are sent as strings e.g "0" or "1"
+def _int_bool(value: str) -> bool:
+    return value != "0"
+
+
+# Split (key, setter, name, caster) entries into the keys, fetched from the
+# metadata in one map() call, and the matching (setter, name, caster) tuples
+def _status_map(*entries):
+    return tuple(entry[0] for entry in entries), tuple(entry[1:] for entry in entries)
+
 
 @logging_helpers()
 class APIAlpha(APIBase):
@@ -26,6 +40,40 @@ class APIAlpha(APIBase):
     HEADER_LENGTH = 3
     JSON_HEADER_LENGTH = HEADER_LENGTH + 1  # action is 1 byte
 
+    # Input source, mute status, device name and stream source
+    ZONE_REQUEST_ACTIONS = (4, 18, 25, 42)
+
+    __slots__ = (
+        "_log_prefix",
+        "vssl",
+        "zone",
+        "_zone_id",
+        "_zone_requests",
+        "_action_handlers",
+        "_status_handlers",
+        "_status_frames",
+        "_volume_steps",
+        "_volume_steps_handle",
+        "_volume_target",
+        "_status_08_map",
+        "_status_09_map",
+        "_status_0A_map",
+        "_status_0B_map",
+        "_set_zone",
+        "_set_settings",
+        "_set_eq",
+        "_set_volume_settings",
+        "_set_analog_input",
+        "_set_subwoofer",
+        "_set_group",
+        "_set_input",
+        "_set_transport",
+        "_set_analog_output",
+        "_set_vssl",
+        "_set_vssl_settings",
+        "_set_power",
+    )
+
     def __init__(self, vssl_host: "core.Vssl", zone: "zone.Zone"):
         super().__init__(host=zone.host, port=self.TCP_PORT)
 
@@ -34,6 +82,150 @@ class APIAlpha(APIBase):
         self.vssl = vssl_host
         self.zone = zone
 
+        # The zone id is fixed for the life of the zone, see Zone.id
+        self._zone_id = int(zone.id)
+
+        # Parameterless zone requests only differ by the zone id, build them once
+        self._zone_requests = {
+            action: bytes([16, action, 1, self._zone_id])
+            for action in self.ZONE_REQUEST_ACTIONS
+        }
+
+        self._build_response_handlers()
+
+        # Bind the property setters once, the handlers call them on every frame.
+        # These objects are created with the zone and VSSL and never replaced
+        self._set_zone = zone._set_property
+        self._set_settings = zone.settings._set_property
+        self._set_eq = zone.settings.eq._set_property
+        self._set_volume_settings = zone.settings.volume._set_property
+        self._set_analog_input = zone.settings.analog_input._set_property
+        self._set_subwoofer = zone.settings.subwoofer._set_property
+        self._set_group = zone.group._set_property
+        self._set_input = zone.input._set_property
+        self._set_transport = zone.transport._set_property
+        self._set_analog_output = zone.analog_output._set_property
+        self._set_vssl = vssl_host._set_property
+        self._set_vssl_settings = vssl_host.settings._set_property
+        self._set_power = vssl_host.settings.power._set_property
+
+        # Last status frame received for each sub action
+        self._status_frames = {}
+
+        # Volume raise / lower steps waiting to be sent
+        self._volume_steps = 0
+        self._volume_steps_handle = None
+        # Volume the sent steps will leave the zone at, until feedback arrives
+        self._volume_target = None
+
+        # Status JSON key -> (setter, property name, caster), using the setters
+        # bound above
+        self._status_08_map = _status_map(
+            (
+                ZoneStatusExtKeys.TRANSPORT_STATE,
+                self._set_transport,
+                "state",
+                int,
+            ),
+            (ZoneStatusExtKeys.VOLUME, self._set_zone, "volume", int),
+            (ZoneStatusExtKeys.MUTE, self._set_zone, "mute", _int_bool),
+            (
+                ZoneStatusExtKeys.PARTY_ZONE,
+                self._set_group,
+                "is_party_zone_member",
+                int,
+            ),
+            (ZoneStatusExtKeys.GROUP_INDEX, self._set_group, "index", int),
+            (
+                ZoneStatusExtKeys.DISABLED,
+                self._set_settings,
+                "disabled",
+                _int_bool,
+            ),
+        )
+        self._status_09_map = _status_map(
+            (ZoneEQStatusExtKeys.MONO, self._set_settings, "mono", int),
+            (
+                ZoneEQStatusExtKeys.ANALOG_INPUT_NAME,
+                self._set_analog_input,
+                "name",
+                str.strip,
+            ),
+        )
+        self._status_0A_map = _status_map(
+            (
+                ZoneRouterStatusExtKeys.EQ_ENABLED,
+                self._set_eq,
+                "enabled",
+                _int_bool,
+            ),
+            (
+                ZoneRouterStatusExtKeys.INPUT_SOURCE,
+                self._set_input,
+                "source",
+                int,
+            ),
+            (
+                ZoneRouterStatusExtKeys.SOURCE_PRIORITY,
+                self._set_input,
+                "priority",
+                int,
+            ),
+            (
+                ZoneRouterStatusExtKeys.POWER_STATE,
+                self._set_power,
+                "state",
+                int,
+            ),
+            (
+                ZoneRouterStatusExtKeys.ANALOG_INPUT_FIXED_GAIN,
+                self._set_analog_input,
+                "fixed_gain",
+                int,
+            ),
+            (
+                ZoneRouterStatusExtKeys.ADAPTIVE_POWER,
+                self._set_power,
+                "adaptive",
+                _int_bool,
+            ),
+        )
+        self._status_0B_map = _status_map(
+            (
+                DeviceStatusExtendedExtKeys.BLUETOOTH_STATUS,
+                self._set_vssl_settings,
+                "bluetooth",
+                int,
+            ),
+            (
+                DeviceStatusExtendedExtKeys.SUBWOOFER_CROSSOVER,
+                self._set_subwoofer,
+                "crossover",
+                int,
+            ),
+        )
+
+    #
+    # Resolve the response_action_XX and response_action_00_XX handlers once
+    # into tables indexed by the action and status sub action byte
+    #
+    def _build_response_handlers(self):
+        self._action_handlers = [self.response_action_default] * 256
+        self._status_handlers = [None] * 256
+
+        for name in dir(type(self)):
+            if not name.startswith("response_action_"):
+                continue
+
+            code = name[len("response_action_") :]
+            try:
+                if len(code) == 2:
+                    self._action_handlers[int(code, 16)] = getattr(self, name)
+                elif len(code) == 5 and code.startswith("00_"):
+                    self._status_handlers[int(code[3:], 16)] = getattr(self, name)
+            except ValueError:
+                continue
+
     #
     # Send keep alive
     #
@@ -48,65 +240,97 @@ class APIAlpha(APIBase):
     #
     #
     def _add_zone_id_to_request(self, command: bytearray, index: int = 3):
-        command[index] = self.zone.id
+        command[index] = self._zone_id
+        return command
+
+    #
+    # Build a variable length request: first byte, action, length, fixed
+    # header bytes then a UTF-8 string. The length counts the header and string
+    #
+    def _string_request(self, action: int, header: bytes, string: str):
+        payload = string.encode("utf-8")
+        body_start = 3 + len(header)
+
+        command = bytearray(body_start + len(payload))
+        command[0] = 16
+        command[1] = action
+        _LEN_B.pack_into(command, 2, len(header) + len(payload))
+        command[3:body_start] = header
+        command[body_start:] = payload
         return command
 
     #
     # 17 [23]
     # Keep Alive
     #
+    KEEP_ALIVE_REQUEST = bytes([16, 23, 1, 7])
+
     def request_action_17(self):
         self._log_debug("Requesting keep alive")
-        self.send(bytearray([16, 23, 1, 7]))
+        self.send(self.KEEP_ALIVE_REQUEST)
 
     #
     # 00 [0] - 00 [0]
     # Status Bus
     #
+    DEVICE_STATUS = bytes([16, 0, 1, 0])
+
     def request_action_00_00(self):
         self._log_debug("Requesting device status")
-        self.send(bytearray([16, 0, 1, 0]))  # HEX: 10000100
+        self.send(self.DEVICE_STATUS)  # HEX: 10000100
 
     #
     # 00 [0] - 08 [8]
     # Status General
     #
-    ZONE_STATUS = bytearray([16, 0, 1, 8])
+    ZONE_STATUS = bytes([16, 0, 1, 8])
 
-    def request_action_00_08(self):
+    #
+    # refresh: apply the status responses even if they repeat the last ones,
+    # e.g the zone reset its track and transport state since
+    #
+    def request_action_00_08(self, refresh: bool = False):
         self._log_debug("Requesting zone status")
+        if refresh:
+            self._status_frames.clear()
         self.send(self.ZONE_STATUS)  # HEX: 10000108
 
     #
     # 00 [0] - 09 [9]
     # Status EQ
     #
+    EQ_STATUS = bytes([16, 0, 1, 9])
+
     def request_action_00_09(self):
         self._log_debug("Requesting EQ status")
-        self.send(bytearray([16, 0, 1, 9]))  # HEX: 10000109
+        self.send(self.EQ_STATUS)  # HEX: 10000109
 
     #
     # 00 [0] - 0A [10]
     # Status Output
     #
+    OUTPUT_STATUS = bytes([16, 0, 1, 10])
+
     def request_action_00_0A(self):
         self._log_debug("Requesting output status")
-        self.send(bytearray([16, 0, 1, 10]))  # HEX: 1000010A
+        self.send(self.OUTPUT_STATUS)  # HEX: 1000010A
 
     #
     # 00 [0] - 0B [11]
     # Status device extended
     #
+    DEVICE_STATUS_EXTENDED = bytes([16, 0, 1, 11])
+
     def request_action_00_0B(self):
         self._log_debug("Requesting device status extended")
-        self.send(bytearray([16, 0, 1, 11]))  # HEX: 1000010B
+        self.send(self.DEVICE_STATUS_EXTENDED)  # HEX: 1000010B
 
     #
     # 03 [3]
     # Input Source Set
     #
     def request_action_03(self, src: int):
-        self._log_debug(f"Requesting to change input source to {src}")
+        self._log_debug("Requesting to change input source to %s", src)
         command = self._add_zone_id_to_request(bytearray([16, 3, 2, 0, src]))
         self.send(command)
 
@@ -116,8 +340,20 @@ class APIAlpha(APIBase):
     #
     def request_action_04(self):
         self._log_debug("Requesting input source")
-        command = self._add_zone_id_to_request(bytearray([16, 4, 1, 0]))
-        self.send(command)
+        self.send(self._zone_requests[4])
+
+    #
+    # 05 [5]
+    # Volume type requests, the last byte selects what is being set
+    #
+    VOLUME_REQUEST = bytes([16, 5, 3, 0, 0, 0])
+
+    def _volume_request(self, value: int, target: int):
+        command = bytearray(self.VOLUME_REQUEST)
+        command[3] = self._zone_id
+        command[4] = value
+        command[5] = target
+        return command
 
     #
     # 05 [5]
@@ -125,9 +361,8 @@ class APIAlpha(APIBase):
     #
     def request_action_05(self, vol: int):
         vol = clamp_volume(vol)
-        self._log_debug(f"Requesting to set volume level: {vol}")
-        command = self._add_zone_id_to_request(bytearray([16, 5, 3, 0, vol, 3]))
-        self.send(command)
+        self._log_debug("Requesting to set volume level: %s", vol)
+        self.send(self._volume_request(vol, 3))
 
     #
     # 05 [5]
@@ -135,8 +370,7 @@ class APIAlpha(APIBase):
     #
     def request_action_05_raise(self):
         self._log_debug("Requesting raise volume")
-        command = self._add_zone_id_to_request(bytearray([16, 5, 3, 0, 255, 3]))
-        self.send(command)
+        self._volume_step(1)
 
     #
     # 05 [5]
@@ -144,8 +378,67 @@ class APIAlpha(APIBase):
     #
     def request_action_05_lower(self):
         self._log_debug("Requesting lower volume")
-        command = self._add_zone_id_to_request(bytearray([16, 5, 3, 0, 254, 3]))
-        self.send(command)
+        self._volume_step(-1)
+
+    #
+    # Volume raise / lower steps made within VOLUME_STEP_WINDOW of each other
+    # (e.g holding a button) are collapsed into a single request
+    #
+    # Several steps are sent as one absolute volume, stepped from the target of
+    # the steps already sent rather than the zone volume, which lags behind
+    # until the volume feedback arrives
+    #
+    VOLUME_STEP_WINDOW = 0.03  # seconds, 0 sends every step straight away
+
+    def _volume_step(self, step: int):
+        if self._volume_steps_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+
+            # Steps in a batch are sent with the batch
+            if not self.VOLUME_STEP_WINDOW or loop is None or self._batch is not None:
+                return self._send_volume_step(step)
+
+            self._volume_steps_handle = loop.call_later(
+                self.VOLUME_STEP_WINDOW, self._flush_volume_steps
+            )
+
+        self._volume_steps += step
+
+    def _flush_volume_steps(self):
+        step = self._volume_steps
+        self._volume_steps = 0
+        self._volume_steps_handle = None
+
+        if step == 1 or step == -1:
+            self._send_volume_step(step)
+        elif step:
+            volume = self.zone.volume
+            if self._volume_target is not None:
+                volume = self._volume_target
+            self._volume_target = clamp_volume(volume + step)
+            self.request_action_05(self._volume_target)
+
+    # A single step keeps using the relative request
+    def _send_volume_step(self, step: int):
+        if self._volume_target is not None:
+            self._volume_target = clamp_volume(self._volume_target + step)
+        self.send(self._volume_request(255 if step > 0 else 254, 3))
+
+    #
+    # Drop any volume steps still waiting to be sent
+    #
+    def _cancel_pending_requests(self):
+        if self._volume_steps_handle is not None:
+            self._volume_steps_handle.cancel()
+            self._volume_steps_handle = None
+        self._volume_steps = 0
+        self._volume_target = None
+
+        # The next connection starts with a fresh status
+        self._status_frames.clear()
 
     #
     # 05 [5]
@@ -153,9 +446,8 @@ class APIAlpha(APIBase):
     #
     def request_action_05_08(self, vol: int):
         vol = clamp_volume(vol)
-        self._log_debug(f"Requesting to set default on volume level: {vol}")
-        command = self._add_zone_id_to_request(bytearray([16, 5, 3, 0, vol, 8]))
-        self.send(command)
+        self._log_debug("Requesting to set default on volume level: %s", vol)
+        self.send(self._volume_request(vol, 8))
 
     #
     # 05 [5]
@@ -163,9 +455,8 @@ class APIAlpha(APIBase):
     #
     def request_action_05_00(self, gain: int):
         gain = clamp_volume(gain)
-        self._log_debug(f"Requesting to set fix analog input gain: {gain}")
-        command = self._add_zone_id_to_request(bytearray([16, 5, 3, 0, gain, 0]))
-        self.send(command)
+        self._log_debug("Requesting to set fix analog input gain: %s", gain)
+        self.send(self._volume_request(gain, 0))
 
     #
     # 05 [5]
@@ -173,9 +464,8 @@ class APIAlpha(APIBase):
     #
     def request_action_05_01(self, vol: int):
         vol = clamp_volume(vol)
-        self._log_debug(f"Requesting to set left max volume: {vol}")
-        command = self._add_zone_id_to_request(bytearray([16, 5, 3, 0, vol, 1]))
-        self.send(command)
+        self._log_debug("Requesting to set left max volume: %s", vol)
+        self.send(self._volume_request(vol, 1))
 
     #
     # 05 [5]
@@ -183,26 +473,27 @@ class APIAlpha(APIBase):
     #
     def request_action_05_02(self, vol: int):
         vol = clamp_volume(vol)
-        self._log_debug(f"Requesting to set right max volume: {vol}")
-        command = self._add_zone_id_to_request(bytearray([16, 5, 3, 0, vol, 2]))
-        self.send(command)
+        self._log_debug("Requesting to set right max volume: %s", vol)
+        self.send(self._volume_request(vol, 2))
 
     #
     # 07 [7]
     # Status Transport State
     #
+    TRANSPORT_STATUS = bytes([16, 7, 1, 0])
+
     def request_action_07(self):
         self._log_debug("Requesting status transport state")
-        self.send(bytearray([16, 7, 1, 0]))
+        self.send(self.TRANSPORT_STATUS)
 
     #
     # 0C [12]
     # Party Mode
     #
     def request_action_0C(self, state: int):
-        self._log_debug(f"Requesting to set party memeber: {state}")
+        self._log_debug("Requesting to set party memeber: %s", state)
         command = self._add_zone_id_to_request(
-            bytearray([16, 11, 2, 0, int(not not state)])
+            bytearray([16, 11, 2, 0, 1 if state else 0])
         )
         self.send(command)
 
@@ -213,7 +504,7 @@ class APIAlpha(APIBase):
     def request_action_0D(self, freq: "EQSettings.Freqs", value: int = 0):
         clamped = max(EQSettings.MIN_VALUE, min(value, EQSettings.MAX_VALUE))
         self._log_debug(
-            f"Requesting to set EQ: {freq.name[1:]} ({freq.value}) to {clamped}"
+            "Requesting to set EQ: %s (%s) to %s", freq.name[1:], freq.value, clamped
         )
         command = self._add_zone_id_to_request(
             bytearray([16, 13, 3, 0, freq.value, clamped])
@@ -225,9 +516,9 @@ class APIAlpha(APIBase):
     # Output Set Mono
     #
     def request_action_mono_set(self, state: int):
-        self._log_debug(f"Requesting to set output to mono: {state}")
+        self._log_debug("Requesting to set output to mono: %s", state)
         command = self._add_zone_id_to_request(
-            bytearray([16, 15, 2, 0, int(not not state)])
+            bytearray([16, 15, 2, 0, 1 if state else 0])
         )
         self.send(command)
 
@@ -236,9 +527,9 @@ class APIAlpha(APIBase):
     # Mute
     #
     def request_action_11(self, state: int):
-        self._log_debug(f"Requesting to mute volume: {state}")
+        self._log_debug("Requesting to mute volume: %s", state)
         command = self._add_zone_id_to_request(
-            bytearray([16, 17, 2, 0, int(not not state)])
+            bytearray([16, 17, 2, 0, 1 if state else 0])
         )
         self.send(command)
 
@@ -247,9 +538,8 @@ class APIAlpha(APIBase):
     # Status Mute
     #
     def request_action_12(self):
-        self._log_debug(f"Requesting status mute")
-        command = self._add_zone_id_to_request(bytearray([16, 18, 1, 0]))
-        self.send(command)
+        self._log_debug("Requesting status mute")
+        self.send(self._zone_requests[18])
 
     #
     # 25 [37]
@@ -259,9 +549,9 @@ class APIAlpha(APIBase):
     # 0 = Enable
     #
     def request_action_25(self, disable: bool = True):
-        self._log_debug(f"Requesting disable zone: {disable}")
+        self._log_debug("Requesting disable zone: %s", disable)
         command = self._add_zone_id_to_request(
-            bytearray([16, 37, 2, 0, int(not not disable)])
+            bytearray([16, 37, 2, 0, 1 if disable else 0])
         )
         self.send(command)
 
@@ -271,13 +561,8 @@ class APIAlpha(APIBase):
     #
     def request_action_15(self, name: str):
         name = name.strip()
-        self._log_debug(f"Requesting to change analog input name: {name}")
-        command = bytearray([16, 21])
-        command.extend(struct.pack(">B", len(name) + 1))
-        command.extend([0])  # zone id placeholder
-        command = self._add_zone_id_to_request(command)
-        command.extend(name.encode("utf-8"))
-        self.send(command)
+        self._log_debug("Requesting to change analog input name: %s", name)
+        self.send(self._string_request(21, bytes([self._zone_id]), name))
 
     #
     # 15 [21]
@@ -285,12 +570,8 @@ class APIAlpha(APIBase):
     #
     def request_action_15_12(self, name: str):
         name = name.strip()
-        self._log_debug(f"Requesting to change optical input name: {name}")
-        command = bytearray([16, 21])
-        command.extend(struct.pack(">B", len(name) + 1))
-        command.extend([12])
-        command.extend(name.encode("utf-8"))
-        self.send(command)
+        self._log_debug("Requesting to change optical input name: %s", name)
+        self.send(self._string_request(21, b"\x0c", name))
 
     #
     # 18 [24]
@@ -298,33 +579,28 @@ class APIAlpha(APIBase):
     #
     def request_action_18(self, name: str):
         name = name.strip()
-        self._log_debug(f"Requesting to change device name: {name}")
-        command = bytearray([16, 24])
-        command.extend(struct.pack(">B", len(name) + 1))
-        command.extend([7])
-        command.extend(name.encode("utf-8"))
-        self.send(command)
+        self._log_debug("Requesting to change device name: %s", name)
+        self.send(self._string_request(24, b"\x07", name))
 
     #
     # 19 [25]
     # Get Device name
     #
     def request_action_19(self):
-        self._log_debug(f"Requesting device name")
-        command = self._add_zone_id_to_request(bytearray([16, 25, 1, 0]))
-        self.send(command)
+        self._log_debug("Requesting device name")
+        self.send(self._zone_requests[25])
 
     #
     # 1D [29]
     # Analog Output Set Src
     #
     def request_action_1D(self, src: int):
-        self._log_debug(f"Requesting to change analog ouput source to {src}")
+        self._log_debug("Requesting to change analog ouput source to %s", src)
         command = self._add_zone_id_to_request(bytearray([16, 29, 2, 0, src]))
         self.send(command)
 
     def request_action_1D_router(self, ao_id: int, src: int):
-        self._log_debug(f"Requesting to change analog ouput {ao_id} source to {src}")
+        self._log_debug("Requesting to change analog ouput %s source to %s", ao_id, src)
         self.send(bytearray([16, 29, 2, ao_id, src]))
 
     #
@@ -332,31 +608,32 @@ class APIAlpha(APIBase):
     # Analog Output Fix Output Vol
     #
     def request_action_49(self, fix: bool):
-        self._log_debug(f"Requesting to fix analog ouput volume {fix}")
+        self._log_debug("Requesting to fix analog ouput volume %s", fix)
         command = self._add_zone_id_to_request(
-            bytearray([16, 73, 2, 0, int(not not fix)])
+            bytearray([16, 73, 2, 0, 1 if fix else 0])
         )
         self.send(command)
 
     def request_action_49_router(self, ao_id: int, fix: bool):
-        self._log_debug(f"Requesting to fix analog ouput {ao_id} volume {fix}")
-        self.send(bytearray([16, 73, 2, ao_id, int(not not fix)]))
+        self._log_debug("Requesting to fix analog ouput %s volume %s", ao_id, fix)
+        self.send(bytearray([16, 73, 2, ao_id, 1 if fix else 0]))
 
     #
     # 3D [61]
     # Transport State
     #
+    TRANSPORT_COMMANDS = {
+        ZoneTransport.States.STOP: 1,
+        ZoneTransport.States.PLAY: 0,
+        ZoneTransport.States.PAUSE: 2,
+    }
+
     def request_action_3D(self, state: ZoneTransport.States):
-        if state == ZoneTransport.States.STOP:
-            cmd = 1
-        elif state == ZoneTransport.States.PLAY:
-            cmd = 0
-        elif state == ZoneTransport.States.PAUSE:
-            cmd = 2
-        else:
+        cmd = self.TRANSPORT_COMMANDS.get(state)
+        if cmd is None:
             return
 
-        self._log_debug(f"Requesting transports state {state.name}, {state.value}")
+        self._log_debug("Requesting transports state %s, %s", state.name, state.value)
         command = self._add_zone_id_to_request(bytearray([16, 61, 2, 0, cmd]))
         self.send(command)
 
@@ -365,18 +642,17 @@ class APIAlpha(APIBase):
     # Status Stream Source
     #
     def request_action_2A(self):
-        self._log_debug(f"Requesting stream source")
-        command = self._add_zone_id_to_request(bytearray([16, 42, 1, 0]))
-        self.send(command)
+        self._log_debug("Requesting stream source")
+        self.send(self._zone_requests[42])
 
     #
     # 2D [45]
     # Disable / Enable EQ
     #
     def request_action_2D(self, state: int):
-        self._log_debug(f"Requesting EQ Enable: {state}")
+        self._log_debug("Requesting EQ Enable: %s", state)
         command = self._add_zone_id_to_request(
-            bytearray([16, 45, 2, 0, int(not not state)])
+            bytearray([16, 45, 2, 0, 1 if state else 0])
         )
         self.send(command)
 
@@ -385,7 +661,7 @@ class APIAlpha(APIBase):
     # Reboot
     #
     def request_action_33(self):
-        self._log_debug(f"Requesting to reboot single zone")
+        self._log_debug("Requesting to reboot single zone")
         command = self._add_zone_id_to_request(bytearray([16, 51, 2, 0, 1]))
         self.send(command)
 
@@ -393,24 +669,28 @@ class APIAlpha(APIBase):
     # 33 [51]
     # Reboot All Zones
     #
+    REBOOT_DEVICE = bytes([16, 51, 2, 0, 1])
+
     def request_action_33_device(self):
         self._log_debug("Requesting to reboot device")
-        self.send(bytearray([16, 51, 2, 0, 1]))
+        self.send(self.REBOOT_DEVICE)
 
     #
     # 2B [43]
     # Factory Reset Device
     #
+    FACTORY_RESET = bytes([16, 43, 2, 8, 0])
+
     def request_action_2B(self):
         self._log_debug("Requesting to factory reset device")
-        self.send(bytearray([16, 43, 2, 8, 0]))
+        self.send(self.FACTORY_RESET)
 
     #
     # 47 [71]
     # Set Input Priority
     #
     def request_action_47(self, priority: int):
-        self._log_debug(f"Requesting to set input priority {priority}")
+        self._log_debug("Requesting to set input priority %s", priority)
         command = self._add_zone_id_to_request(bytearray([16, 71, 2, 0, priority]))
         self.send(command)
 
@@ -421,7 +701,7 @@ class APIAlpha(APIBase):
     # In other words: set the zones (zone_index) parent to this zone
     #
     def request_action_4B_add(self, zone_index: int):
-        self._log_debug(f"Requesting to add child zone {zone_index} to group")
+        self._log_debug("Requesting to add child zone %s to group", zone_index)
         command = self._add_zone_id_to_request(bytearray([16, 75, 2, 0, zone_index]))
         self.send(command)
 
@@ -432,7 +712,7 @@ class APIAlpha(APIBase):
     # In other words: set the zones parent to 255
     #
     def request_action_4B_remove(self, zone_index: int):
-        self._log_debug(f"Requesting to remove child zone {zone_index} from group")
+        self._log_debug("Requesting to remove child zone %s from group", zone_index)
         # Doesnt need a zone id
         self.send(bytearray([16, 75, 2, 255, zone_index]))
 
@@ -443,7 +723,7 @@ class APIAlpha(APIBase):
     # In other words: set this zones childen to 255
     #
     def request_action_4B_dissolve(self):
-        self._log_debug(f"Requesting to Dissolve group")
+        self._log_debug("Requesting to Dissolve group")
         command = self._add_zone_id_to_request(bytearray([16, 75, 2, 0, 255]))
         self.send(command)
 
@@ -476,18 +756,11 @@ class APIAlpha(APIBase):
     def request_action_55(self, url: str, all_zones: bool = False):
         string = "PLAYITEM:DIRECT:" + f"{url}"
 
-        command = bytearray([16, 85])
-        command.extend(struct.pack(">B", len(string) + 2))
-
         # Zone 0 will play on all zones
-        command.extend([0, self.zone.volume])
-
-        if not all_zones:
-            command = self._add_zone_id_to_request(command)
+        zone_id = 0 if all_zones else self._zone_id
+        command = self._string_request(85, bytes([zone_id, self.zone.volume]), string)
 
-        command.extend(string.encode("utf-8"))
-
-        self._log_debug(f"Requesting to play file {url} cmd: {command}")
+        self._log_debug("Requesting to play file %s cmd: %s", url, command)
         self.send(command)
 
     #
@@ -495,7 +768,7 @@ class APIAlpha(APIBase):
     # Adaptive Power - Device level Command
     #
     def request_action_4F(self, state=True):
-        self._log_debug(f"Requesting to set adaptive power state: {state}")
+        self._log_debug("Requesting to set adaptive power state: %s", state)
         # Device level command (dont need zone)
         command = bytearray([16, 79, 2, 8, int(state)])
         self.send(command)
@@ -509,12 +782,13 @@ class APIAlpha(APIBase):
     #
 
     async def _read_byte_stream(self, reader, data):
-        data += await reader.readexactly(self.HEADER_LENGTH - APIBase.FRIST_BYTE)
         length = data[2]
 
+        # Handlers index the whole frame as plain bytes
         data += await reader.readexactly(length)
 
-        self._log_debug(f"Response data: {data}")
+        if self._is_log_level("debug"):
+            self._log_debug(f"Response data: {data}")
 
         if length == 1:
             return self.response_action_confimation(data)
@@ -523,51 +797,48 @@ class APIAlpha(APIBase):
 
     async def _handle_response(self, response: bytes):
         try:
-            # Convert to HEX and split into a array
-            hexl = response.hex("-").split("-")
-            action = f"response_action_{hexl[1].upper()}"
+            # The action is the second byte and indexes the handler table
+            method = self._action_handlers[response[1]]
 
-            self._log_debug(f"Response action: {action}")
+            if self._is_log_level("debug"):
+                self._log_debug(f"Response action: {method.__name__}")
 
         except Exception as error:
-            self._log_error(f"couldnt handle response: {error} | {hexl}")
+            self._log_error(f"couldnt handle response: {error} | {response}")
             return None
 
-        if hasattr(self, action):
-            method = getattr(self, action)
-            if callable(method):
-                return method(hexl, response)
-
-        # Default
-        return self.response_action_default(hexl, response)
+        return method(response)
 
     #
     # 00 [0]
     # Received JSON Status Data
     #
-    def response_action_00(self, hexl: list, response: bytes):
+    def response_action_00(self, response: bytes):
         try:
-            packet_length = hexl[2]
+            # Resolve the sub action first so unknown status frames are not parsed
+            method = self._status_handlers[response[3]]
 
-            length = hex_to_int(packet_length) - 1
-            string = response[
-                self.JSON_HEADER_LENGTH : self.JSON_HEADER_LENGTH + length
-            ].decode("ascii")
-            metadata = json.loads(string)
+            if method is None:
+                if self._is_log_level("debug"):
+                    self._log_debug(f"Unknown status sub action {response[3]:02X}")
+                return None
 
-            # Call a sub action
-            sub_action = f"response_action_00_{hexl[3].upper()}"
+            # Polling returns the same status most of the time, a frame that is
+            # byte for byte the last one can not change anything so skip the parse
+            if self._status_frames.get(response[3]) == response:
+                return None
+            self._status_frames[response[3]] = response
 
-            if hasattr(self, sub_action):
-                method = getattr(self, sub_action)
-                if callable(method):
-                    self._log_debug(f"Calling status sub action: {sub_action}")
-                    return method(metadata)
+            # The JSON runs from the end of the header to the end of the frame,
+            # slice a view so the payload is not copied before parsing
+            metadata = json_loads(memoryview(response)[self.JSON_HEADER_LENGTH :])
 
-            self._log_debug(f"Unknown status sub action {sub_action}")
+            if self._is_log_level("debug"):
+                self._log_debug(f"Calling status sub action: {method.__name__}")
+            return method(metadata)
 
         except Exception as error:
-            self._log_error(f"Couldnt parse JSON: {error} | {hexl}")
+            self._log_error(f"Couldnt parse JSON: {error} | {response}")
 
     """ 
         00_00
@@ -586,7 +857,7 @@ class APIAlpha(APIBase):
     """
 
     def response_action_00_00(self, metadata: list):
-        self._log_debug(f"Received 00 Status: {metadata}")
+        self._log_debug("Received 00 Status: %s", metadata)
 
         # Guess device model
         self.vssl._infer_device_model(metadata)
@@ -594,30 +865,39 @@ class APIAlpha(APIBase):
         # Analog output source
         key = DeviceStatusExtKeys.add_zone_to_bus_key(self.zone.id)
         if key in metadata:
-            self.zone.analog_output._set_property("source", int(metadata[key]))
+            self._set_analog_output("source", int(metadata[key]))
 
         # B1Nm - Bus1 Name
         # Not used?
 
         # B2Nm - Bus2 Name - For A3.X this is the optical input name
         if DeviceStatusExtKeys.OPTICAL_INPUT_NAME in metadata:
-            self.vssl.settings._set_property(
+            self._set_vssl_settings(
                 "optical_input_name",
                 metadata[DeviceStatusExtKeys.OPTICAL_INPUT_NAME].strip(),
             )
 
         # Set the device name
         if DeviceStatusExtKeys.DEVICE_NAME in metadata:
-            self.vssl.settings._set_property(
+            self._set_vssl_settings(
                 "name", metadata[DeviceStatusExtKeys.DEVICE_NAME].strip()
             )
 
         # Set the software version
         if DeviceStatusExtKeys.SW_VERSION in metadata and self.vssl.sw_version == None:
-            self.vssl._set_property(
+            self._set_vssl(
                 "sw_version", metadata[DeviceStatusExtKeys.SW_VERSION].strip()
             )
 
+    #
+    # Set each property whose key is present in the status metadata
+    #
+    def _map_status(self, status_map: tuple, metadata: dict):
+        keys, setters = status_map
+        for (setter, name, cast), value in zip(setters, map(metadata.get, keys)):
+            if value is not None:
+                setter(name, cast(value))
+
     """
         00_08
         Zone Status 08
@@ -645,7 +925,7 @@ class APIAlpha(APIBase):
     """
 
     def response_action_00_08(self, metadata: list):
-        self._log_debug(f"Received 08 Status: {metadata}")
+        self._log_debug("Received 08 Status: %s", metadata)
 
         # If the zone is not initialised, then we just return the ID and serial
         if not self.zone.initialised:
@@ -657,51 +937,17 @@ class APIAlpha(APIBase):
             if ZoneStatusExtKeys.SERIAL_NUMBER in metadata:
                 # Always set VSSL first before zone
                 if self.vssl.serial == None:
-                    self.vssl._set_property(
-                        "serial", metadata[ZoneStatusExtKeys.SERIAL_NUMBER]
-                    )
+                    self._set_vssl("serial", metadata[ZoneStatusExtKeys.SERIAL_NUMBER])
 
                 if self.zone.serial == None:
-                    self.zone._set_property(
-                        "serial", metadata[ZoneStatusExtKeys.SERIAL_NUMBER]
-                    )
-
-        # Transport state
-        if ZoneStatusExtKeys.TRANSPORT_STATE in metadata:
-            self.zone.transport._set_property(
-                "state", int(metadata[ZoneStatusExtKeys.TRANSPORT_STATE])
-            )
+                    self._set_zone("serial", metadata[ZoneStatusExtKeys.SERIAL_NUMBER])
 
-        # Volume
-        if ZoneStatusExtKeys.VOLUME in metadata:
-            self.zone._set_property("volume", int(metadata[ZoneStatusExtKeys.VOLUME]))
-
-        # Mute
-        if ZoneStatusExtKeys.MUTE in metadata:
-            self.zone._set_property("mute", bool(int(metadata[ZoneStatusExtKeys.MUTE])))
-
-        # Party Mode
-        if ZoneStatusExtKeys.PARTY_ZONE in metadata:
-            self.zone.group._set_property(
-                "is_party_zone_member", int(metadata[ZoneStatusExtKeys.PARTY_ZONE])
-            )
-
-        # Group Index see below
-        if ZoneStatusExtKeys.GROUP_INDEX in metadata:
-            self.zone.group._set_property(
-                "index", int(metadata[ZoneStatusExtKeys.GROUP_INDEX])
-            )
+        self._map_status(self._status_08_map, metadata)
 
         # Set Stream Source
         if ZoneStatusExtKeys.TRACK_SOURCE in metadata:
             self.zone.track.source = int(metadata[ZoneStatusExtKeys.TRACK_SOURCE])
 
-        # Zone Enabled (0) or Disabled (1)
-        if ZoneStatusExtKeys.DISABLED in metadata:
-            self.zone.settings._set_property(
-                "disabled", bool(int(metadata[ZoneStatusExtKeys.DISABLED]))
-            )
-
     """
         00_09
         EQ Status
@@ -724,20 +970,9 @@ class APIAlpha(APIBase):
     """
 
     def response_action_00_09(self, metadata: list):
-        self._log_debug(f"Received 09 Status: {metadata}")
-
-        # Mono output
-        if ZoneEQStatusExtKeys.MONO in metadata:
-            self.zone.settings._set_property(
-                "mono", int(metadata[ZoneEQStatusExtKeys.MONO])
-            )
-
-        # Analog Input Name
-        if ZoneEQStatusExtKeys.ANALOG_INPUT_NAME in metadata:
-            self.zone.settings.analog_input._set_property(
-                "name", metadata[ZoneEQStatusExtKeys.ANALOG_INPUT_NAME].strip()
-            )
+        self._log_debug("Received 09 Status: %s", metadata)
 
+        self._map_status(self._status_09_map, metadata)
         self.zone.settings.eq._map_response_dict(metadata)
         self.zone.settings.volume._map_response_dict(metadata)
 
@@ -764,65 +999,28 @@ class APIAlpha(APIBase):
     """
 
     def response_action_00_0A(self, metadata: list):
-        self._log_debug(f"Received 0A Status: {metadata}")
+        self._log_debug("Received 0A Status: %s", metadata)
 
-        # EQ Switch
-        if ZoneRouterStatusExtKeys.EQ_ENABLED in metadata:
-            self.zone.settings.eq._set_property(
-                "enabled", bool(int(metadata[ZoneRouterStatusExtKeys.EQ_ENABLED]))
-            )
-
-        # Input Source
-        if ZoneRouterStatusExtKeys.INPUT_SOURCE in metadata:
-            self.zone.input._set_property(
-                "source", int(metadata[ZoneRouterStatusExtKeys.INPUT_SOURCE])
-            )
-
-        # Source Priority
-        if ZoneRouterStatusExtKeys.SOURCE_PRIORITY in metadata:
-            self.zone.input._set_property(
-                "priority", int(metadata[ZoneRouterStatusExtKeys.SOURCE_PRIORITY])
-            )
+        self._map_status(self._status_0A_map, metadata)
 
         # Analog Output Fix Volume
         #  e.g BF1
         key = ZoneRouterStatusExtKeys.add_zone_to_ao_fixed_volume_key(self.zone.id)
         if key in metadata:
-            self.zone.analog_output._set_property(
-                "is_fixed_volume", bool(int(metadata[key]))
-            )
+            self._set_analog_output("is_fixed_volume", metadata[key] != "0")
 
         # Handle groups
         if (
             ZoneRouterStatusExtKeys.GROUP_MASTER in metadata
             and ZoneRouterStatusExtKeys.GROUP_SOURCE in metadata
         ):
-            self.zone.group._set_property(
+            self._set_group(
                 "source", int(metadata[ZoneRouterStatusExtKeys.GROUP_SOURCE])
             )
-            self.zone.group._set_property(
+            self._set_group(
                 "is_master", int(metadata[ZoneRouterStatusExtKeys.GROUP_MASTER])
             )
 
-        # Power State
-        if ZoneRouterStatusExtKeys.POWER_STATE in metadata:
-            self.vssl.settings.power._set_property(
-                "state", int(metadata[ZoneRouterStatusExtKeys.POWER_STATE])
-            )
-
-        # Analog input fixed gain
-        if ZoneRouterStatusExtKeys.ANALOG_INPUT_FIXED_GAIN in metadata:
-            self.zone.settings.analog_input._set_property(
-                "fixed_gain",
-                int(metadata[ZoneRouterStatusExtKeys.ANALOG_INPUT_FIXED_GAIN]),
-            )
-
-        # Alway On power state = 0 else 1 = auto
-        if ZoneRouterStatusExtKeys.ADAPTIVE_POWER in metadata:
-            self.vssl.settings.power._set_property(
-                "adaptive", bool(int(metadata[ZoneRouterStatusExtKeys.ADAPTIVE_POWER]))
-            )
-
     """
         00_0B
         Device Status Extended 0B
@@ -839,29 +1037,18 @@ class APIAlpha(APIBase):
     """
 
     def response_action_00_0B(self, metadata: list):
-        self._log_debug(f"Received 0B Status: {metadata}")
+        self._log_debug("Received 0B Status: %s", metadata)
 
-        # Bluetooth
-        if DeviceStatusExtendedExtKeys.BLUETOOTH_STATUS in metadata:
-            self.vssl.settings._set_property(
-                "bluetooth", int(metadata[DeviceStatusExtendedExtKeys.BLUETOOTH_STATUS])
-            )
-
-        # Subwoofer Crossover
-        if DeviceStatusExtendedExtKeys.SUBWOOFER_CROSSOVER in metadata:
-            self.zone.settings.subwoofer._set_property(
-                "crossover",
-                int(metadata[DeviceStatusExtendedExtKeys.SUBWOOFER_CROSSOVER]),
-            )
+        self._map_status(self._status_0B_map, metadata)
 
     #
     # 2A [42]
     # Stream Source
     #
-    def response_action_2A(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            source = hex_to_int(hexl[4])
-            self._log_debug(f"Received stream source: {source}")
+    def response_action_2A(self, response: bytes):
+        if response[2] == 2:
+            source = response[4]
+            self._log_debug("Received stream source: %s", source)
             self.zone.track.source = source
 
     #
@@ -870,12 +1057,14 @@ class APIAlpha(APIBase):
     #
     # Note: This is received on the zone which is the same as the output ID
     #
-    def response_action_1E(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            output = hex_to_int(hexl[3])
-            source = hex_to_int(hexl[4])
-            self._log_debug(f"Received analog output {output} source change: {source}")
-            self.zone.analog_output._set_property("source", source)
+    def response_action_1E(self, response: bytes):
+        if response[2] == 2:
+            output = response[3]
+            source = response[4]
+            self._log_debug(
+                "Received analog output %s source change: %s", output, source
+            )
+            self._set_analog_output("source", source)
 
     #
     # 4A [74]
@@ -883,56 +1072,58 @@ class APIAlpha(APIBase):
     #
     # Note: This is received on the zone which is the same as the output ID
     #
-    def response_action_4A(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            output = hex_to_int(hexl[3])
-            state = hex_to_int(hexl[4])
-            self._log_debug(f"Received analog output {output} volume fixed: {state}")
-            self.zone.analog_output._set_property("is_fixed_volume", bool(state))
+    def response_action_4A(self, response: bytes):
+        if response[2] == 2:
+            output = response[3]
+            state = response[4]
+            self._log_debug("Received analog output %s volume fixed: %s", output, state)
+            self._set_analog_output("is_fixed_volume", bool(state))
 
     #
     # 04 [4]
     # Received Input Source
     #
-    def response_action_04(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            source = hex_to_int(hexl[4])
-            self._log_debug(f"Received input source: {source}")
-            self.zone.input._set_property("source", source)
+    def response_action_04(self, response: bytes):
+        if response[2] == 2:
+            source = response[4]
+            self._log_debug("Received input source: %s", source)
+            self._set_input("source", source)
 
     #
     # 06 [6]
     # Received Volume Data
     #
-    def response_action_06(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 3:
-            vol = hex_to_int(hexl[4])
-            vol_cmd = hex_to_int(hexl[5])
+    def response_action_06(self, response: bytes):
+        if response[2] == 3:
+            vol = response[4]
+            vol_cmd = response[5]
 
-            self._log_debug(f"Received volume cmd: {vol_cmd} vol: {vol}")
-            self._log_debug(f"Received volume {response.hex()}")
+            self._log_debug("Received volume cmd: %s vol: %s", vol_cmd, vol)
+            if self._is_log_level("debug"):
+                self._log_debug("Received volume %s", response.hex())
 
             # Analog input fixed gain
             if vol_cmd == 0:
-                self.zone.settings.analog_input._set_property("fixed_gain", vol)
+                self._set_analog_input("fixed_gain", vol)
 
             # Max Left
             elif vol_cmd == 1:
-                self.zone.settings.volume._set_property("max_left", vol)
+                self._set_volume_settings("max_left", vol)
 
             # Max Right
             elif vol_cmd == 2:
-                self.zone.settings.volume._set_property("max_right", vol)
+                self._set_volume_settings("max_right", vol)
 
             # Normal Volume Change
             elif vol_cmd == 3:
-                self.zone._set_property("volume", vol)
+                self._volume_target = None
+                self._set_zone("volume", vol)
 
             # Defaul On Volume Change
             elif vol_cmd == 8:
-                self.zone.settings.volume._set_property("default_on", vol)
+                self._set_volume_settings("default_on", vol)
         else:
-            self._log_debug(f"Volume Error")
+            self._log_debug("Volume Error")
 
     #
     # 07 [7]
@@ -942,11 +1133,11 @@ class APIAlpha(APIBase):
     # 1 = play
     # 2 = pause
     #
-    def response_action_07(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            state = hex_to_int(hexl[4])
-            self._log_debug(f"Received transport state: {state}")
-            self.zone.transport._set_property("state", state)
+    def response_action_07(self, response: bytes):
+        if response[2] == 2:
+            state = response[4]
+            self._log_debug("Received transport state: %s", state)
+            self._set_transport("state", state)
 
     #
     # 0C [12]
@@ -954,41 +1145,41 @@ class APIAlpha(APIBase):
     #
     # Not supported on X series
     #
-    def response_action_0C(self, hexl: list, response: bytes):
-        state = hex_to_int(hexl[4])
-        self._log_debug(f"Received party member state: {state}")
-        self.zone.group._set_property("is_party_zone_member", state)
+    def response_action_0C(self, response: bytes):
+        state = response[4]
+        self._log_debug("Received party member state: %s", state)
+        self._set_group("is_party_zone_member", state)
 
     #
     # 0E [14]
     # EQ
     #
-    def response_action_0E(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 3:
-            freq = hex_to_int(hexl[4])
-            value = hex_to_int(hexl[5])
-            self._log_debug(f"Received EQ frequency:{freq} value: {value}")
+    def response_action_0E(self, response: bytes):
+        if response[2] == 3:
+            freq = response[4]
+            value = response[5]
+            self._log_debug("Received EQ frequency:%s value: %s", freq, value)
             self.zone.settings.eq._set_eq_freq(freq, value)
 
     #
     # 10 [16]
     # Mono output
     #
-    def response_action_10(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            state = hex_to_int(hexl[4])
-            self._log_debug(f"Received mono ouput: {state}")
-            self.zone.settings._set_property("mono", state)
+    def response_action_10(self, response: bytes):
+        if response[2] == 2:
+            state = response[4]
+            self._log_debug("Received mono ouput: %s", state)
+            self._set_settings("mono", state)
 
     #
     # 12 [18]
     # Mute status
     #
-    def response_action_12(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            is_muted = bool(hex_to_int(hexl[4]))
-            self._log_debug(f"Received mute status 12: {is_muted}")
-            self.zone._set_property("mute", is_muted)
+    def response_action_12(self, response: bytes):
+        if response[2] == 2:
+            is_muted = bool(response[4])
+            self._log_debug("Received mute status 12: %s", is_muted)
+            self._set_zone("mute", is_muted)
 
     #
     # 16 [22]
@@ -996,27 +1187,27 @@ class APIAlpha(APIBase):
     #
     # TODO, maybe this should be global with the analog outputs
     #
-    def response_action_16(self, hexl: list, response: bytes):
-        self._log_debug(f"Received analog input name: {hexl}")
+    def response_action_16(self, response: bytes):
+        self._log_debug("Received analog input name: %s", response)
 
-        input_id = hex_to_int(hexl[3])
-        name = response[4:].decode("ascii")
+        input_id = response[3]
+        name = str(memoryview(response)[4:], "ascii")
 
-        if input_id == self.zone.id:
-            self._log_debug(f"Received analog input {input_id} name: {name}")
-            self.zone.settings.analog_input._set_property("name", name.strip())
+        if input_id == self._zone_id:
+            self._log_debug("Received analog input %s name: %s", input_id, name)
+            self._set_analog_input("name", name.strip())
 
         # Optical Input
         elif input_id == 12:
-            self._log_debug(f"Received optical input name: {name}")
-            self.vssl.settings._set_property("optical_input_name", name.strip())
+            self._log_debug("Received optical input name: %s", name)
+            self._set_vssl_settings("optical_input_name", name.strip())
 
     #
     # 17 [23]
     # Keep Alive
     #
-    def response_action_17(self, hexl: list, response: bytes):
-        self._log_debug(f"Received keep alive: {response}")
+    def response_action_17(self, response: bytes):
+        self._log_debug("Received keep alive: %s", response)
         # TODO
         pass
 
@@ -1024,16 +1215,19 @@ class APIAlpha(APIBase):
     # 19 [25]
     # Received Device Name
     #
-    def response_action_19(self, hexl: list, response: bytes):
+    def response_action_19(self, response: bytes):
         try:
-            length = hex_to_int(hexl[2]) - 1
-            name = response[
-                self.JSON_HEADER_LENGTH : self.JSON_HEADER_LENGTH + length
-            ].decode("ascii")
+            length = response[2] - 1
+            name = str(
+                memoryview(response)[
+                    self.JSON_HEADER_LENGTH : self.JSON_HEADER_LENGTH + length
+                ],
+                "ascii",
+            )
 
-            self._log_debug(f"Received device name: {name}")
+            self._log_debug("Received device name: %s", name)
 
-            self.vssl.settings._set_property("name", name.strip())
+            self._set_vssl_settings("name", name.strip())
 
         except Exception as error:
             self._log_error(f"Exception occurred receiving device name: {error}")
@@ -1042,22 +1236,22 @@ class APIAlpha(APIBase):
     # 26 [38]
     # Zone Enabled / Disabled Feedback
     #
-    def response_action_26(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 3:
-            # hexl[4] is the zone id
-            disabled = hex_to_int(hexl[5])
-            self._log_debug(f"Received zone disable: {disabled}")
-            self.zone.settings._set_property("disabled", bool(disabled))
+    def response_action_26(self, response: bytes):
+        if response[2] == 3:
+            # response[4] is the zone id
+            disabled = response[5]
+            self._log_debug("Received zone disable: %s", disabled)
+            self._set_settings("disabled", bool(disabled))
 
     #
     # 2E [46]
     # EQ Switch
     #
-    def response_action_2E(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            enabled = hex_to_int(hexl[4])
-            self._log_debug(f"Received EQ Switch: {enabled}")
-            self.zone.settings.eq._set_property("enabled", bool(enabled))
+    def response_action_2E(self, response: bytes):
+        if response[2] == 2:
+            enabled = response[4]
+            self._log_debug("Received EQ Switch: %s", enabled)
+            self._set_eq("enabled", bool(enabled))
 
     #
     # 32 [50]
@@ -1068,64 +1262,68 @@ class APIAlpha(APIBase):
     #
     # When a stream is started, a 'rm' is allocated to the zone.
     # RM feedback is 0 when not playing and removed from a group
-    def response_action_32(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            index = hex_to_int(hexl[4])
-            self._log_debug(f"Received group index: {index}")
-            self.zone.group._set_property("index", int(index))
+    def response_action_32(self, response: bytes):
+        if response[2] == 2:
+            index = response[4]
+            self._log_debug("Received group index: %s", index)
+            self._set_group("index", index)
 
     #
     # 4C [76]
     # Group Response
     #
-    def response_action_4C(self, hexl: list, response: bytes):
-        self._log_debug(f"Received group info: {hexl}")
+    def response_action_4C(self, response: bytes):
+        self._log_debug("Received group info: %s", response)
 
-        if hex_to_int(hexl[2]) == 3:
-            if hex_to_int(hexl[3]) != self.zone.id:
+        if response[2] == 3:
+            if response[3] != self._zone_id:
                 self._log_warning(
-                    f"Z{self.zone.id} Alpha - incorrect zone id in group response"
+                    f"Z{self._zone_id} Alpha - incorrect zone id in group response"
                 )
                 return
 
-            self.zone.group._set_property("source", hex_to_int(hexl[5]))
-            self.zone.group._set_property("is_master", hex_to_int(hexl[4]))
+            self._set_group("source", response[5])
+            self._set_group("is_master", response[4])
 
     #
     # 48 [72]
     # Input Priority Feedback
     #
-    def response_action_48(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            priority = hex_to_int(hexl[4])
-            self._log_debug(f"Received input priority: {priority}")
-            self.zone.input._set_property("priority", priority)
+    def response_action_48(self, response: bytes):
+        if response[2] == 2:
+            priority = response[4]
+            self._log_debug("Received input priority: %s", priority)
+            self._set_input("priority", priority)
 
     #
     # 50 [80]
     # Adaptive Power Feedback
     #
-    def response_action_50(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[2]) == 2:
-            enabled = hex_to_int(hexl[4])
-            self._log_debug(f"Received adaptive power setting: {enabled}")
-            self.vssl.settings.power._set_property("adaptive", bool(int(enabled)))
+    def response_action_50(self, response: bytes):
+        if response[2] == 2:
+            enabled = response[4]
+            self._log_debug("Received adaptive power setting: %s", enabled)
+            self._set_power("adaptive", enabled != 0)
 
     #
     # Command confimation
     #
     def response_action_confimation(self, response: bytes):
-        cmd = response.hex()
-        self._log_debug(
-            f"Received command confimation: {hex_to_bytearray_string(cmd)} Hex: {cmd}"
-        )
+        if self._is_log_level("debug"):
+            self._log_debug(
+                "Received command confimation: %s Hex: %s",
+                bytes_to_bytearray_string(response),
+                response.hex(),
+            )
 
     #
     # Default
     # Default Action
     #
-    def response_action_default(self, hexl: list, response: bytes):
-        cmd = response.hex()
-        self._log_debug(
-            f"Received unknown command: {hex_to_bytearray_string(cmd)} Hex: {cmd}"
-        )
+    def response_action_default(self, response: bytes):
+        if self._is_log_level("debug"):
+            self._log_debug(
+                "Received unknown command: %s Hex: %s",
+                bytes_to_bytearray_string(response),
+                response.hex(),
+            )
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 import asyncio
+from collections import deque
+from contextlib import contextmanager
 from random import randrange
 from asyncio.exceptions import IncompleteReadError
 import logging
-from typing import Callable, final
+import socket
+from typing import Callable, ClassVar, final
 
 from .utils import cancel_task
 from .exceptions import ZoneConnectionError
@@ -27,12 +30,20 @@ class APITaskGroup:
             self.add(task)
 
     async def cancel(self):
-        # Cancel all tasks in the group
-        for task in self._tasks:
-            cancel_task(task)
+        # Cancel all tasks in the group and wait for them to finish. When a
+        # task in the group is the caller (e.g reconnecting after a lost
+        # connection) it is left to finish the disconnect and exit its loop
+        current = asyncio.current_task()
+        tasks = [task for task in self._tasks if task is not current]
         self._tasks = []
 
-    async def wait():
+        for task in tasks:
+            cancel_task(task)
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def wait(self):
         return await asyncio.gather(*self._tasks)
 
 
@@ -43,7 +54,31 @@ class APIBase(ABC):
     BACKOFF_MIN = 15  # seconds
     BACKOFF_MAX = 300  # 5 minutes
 
-    FRIST_BYTE = 1
+    # Set by each API, the fixed number of bytes read before the frame body
+    HEADER_LENGTH: ClassVar[int]
+
+    # VSSL cant handle too many requests, pause between writes
+    SEND_INTERVAL = 0.2  # seconds
+    # Join requests already waiting in the queue into one write of up to this
+    # many bytes. 0 sends one request per write
+    SEND_COALESCE_BYTES = 0
+
+    __slots__ = (
+        "host",
+        "port",
+        "_reader",
+        "_writer",
+        "_writer_queue",
+        "_writer_wakeup",
+        "_batch",
+        "_disconnecting",
+        "_connecting",
+        "connection_event",
+        "_keep_alive_received",
+        "_keep_connected_task",
+        "_reconnection_attempts",
+        "_task_group",
+    )
 
     def __init__(self, host, port):
         self.host = host
@@ -51,11 +86,16 @@ class APIBase(ABC):
 
         self._reader = None
         self._writer = None
-        self._writer_queue: asyncio.Queue = asyncio.Queue()
+        # Single producer (send) and single consumer (_send_bytes), so a plain
+        # deque with an event to wake the send task is all that is needed
+        self._writer_queue: deque = deque()
+        self._writer_wakeup = None
+        self._batch = None
 
         self._disconnecting = False
         self._connecting = False
-        self.connection_event = asyncio.Event()
+        # Created on connect, so the events belong to the running loop
+        self.connection_event = None
 
         self._keep_alive_received = False
         self._keep_connected_task = None
@@ -76,9 +116,44 @@ class APIBase(ABC):
     #
     # Send a request
     #
+    # Requests are built as bytes or bytearray, checked once here rather than
+    # on every write in the send task
+    #
     def send(self, data):
-        if self._writer_queue and self.connected:
-            self._writer_queue.put_nowait(data)
+        if not isinstance(data, (bytes, bytearray)):
+            raise TypeError("Currently only accept bytes or bytearray!")
+
+        if self._batch is not None:
+            self._batch.append(data)
+        elif self.connected:
+            self._writer_queue.append(data)
+            self._writer_wakeup.set()
+
+    #
+    # Send several requests as a single write
+    #
+    def send_many(self, commands):
+        self.send(b"".join(commands))
+
+    #
+    # Collect the requests sent within the block and flush them as one write
+    #
+    # The device is sent the requests back to back, without the usual pause
+    # between writes, so only batch requests it can handle together.
+    #
+    @contextmanager
+    def batch(self):
+        if self._batch is not None:
+            yield self
+            return
+
+        self._batch = []
+        try:
+            yield self
+        finally:
+            commands, self._batch = self._batch, None
+            if commands:
+                self.send_many(commands)
 
     #
     # Connect
@@ -89,6 +164,7 @@ class APIBase(ABC):
             return self.connected
 
         self._connecting = True
+        self._create_events()
 
         try:
             self._log_debug(f"Attemping connection to {self.host}:{self.port}")
@@ -96,6 +172,8 @@ class APIBase(ABC):
                 asyncio.open_connection(self.host, self.port), self.TIMEOUT
             )
 
+            self._set_tcp_keepalive()
+
             # Connected
             self.connection_event.set()
 
@@ -105,7 +183,7 @@ class APIBase(ABC):
             # Groups tasks for easy handling
             self._task_group.extend(
                 [
-                    self._receive_first_byte(),
+                    self._receive_header(),
                     self._send_bytes(),
                     self._send_keepalive_base(),
                 ]
@@ -134,6 +212,40 @@ class APIBase(ABC):
 
         return self.connected
 
+    #
+    # Let the kernel probe the connection too, so a dead peer is detected
+    # without a timer around every read
+    #
+    def _set_tcp_keepalive(self):
+        sock = self._writer.get_extra_info("socket")
+        if sock is None:
+            return
+
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+            # Not available on every platform
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.KEEP_ALIVE
+                )
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.KEEP_ALIVE
+                )
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        except OSError as e:
+            self._log_debug("Unable to set TCP keep alive: %s", e)
+
+    #
+    # Create the asyncio events on first connect
+    #
+    def _create_events(self):
+        if self.connection_event is None:
+            self.connection_event = asyncio.Event()
+            self._writer_wakeup = asyncio.Event()
+
     #
     # Disconnect
     #
@@ -142,7 +254,10 @@ class APIBase(ABC):
         self._disconnecting = True
 
         # cancel any reconnecting loops
-        self._cancel_keep_connected()
+        await self._stop_keep_connected()
+
+        # Nothing queued for later should be sent once we are disconnecting
+        self._cancel_pending_requests()
 
         # Break Loops
         if self.connection_event:
@@ -218,15 +333,19 @@ class APIBase(ABC):
                 await self.connect()
                 self._cancel_keep_connected()
             except ZoneConnectionError as e:
+                # A connection attempt cancelled by disconnect surfaces as a
+                # ZoneConnectionError, dont retry it
+                if self._disconnecting:
+                    break
+
                 self._reconnection_attempts += 1
 
+                # Double the wait each attempt, plus jitter so zones that
+                # dropped together dont all reconnect at the same moment
                 backoff = min(
-                    max(
-                        self.BACKOFF_MIN,
-                        self.BACKOFF_MIN * self._reconnection_attempts,
-                    ),
+                    self.BACKOFF_MIN << min(self._reconnection_attempts - 1, 5),
                     self.BACKOFF_MAX,
-                )
+                ) + randrange(self.BACKOFF_MIN)
 
                 self._log_info(
                     f"{self.host}:{self.port}: reconnecting in {backoff} seconds"
@@ -242,6 +361,22 @@ class APIBase(ABC):
         cancel_task(self._keep_connected_task)
         self._reconnection_attempts = 0
 
+    #
+    # Cancel the keep connected task and wait for it to unwind, bounded by the
+    # connection timeout, so an in flight connection attempt doesnt outlive us
+    #
+    @final
+    async def _stop_keep_connected(self):
+        task = self._keep_connected_task
+        self._cancel_keep_connected()
+
+        if (
+            isinstance(task, asyncio.Task)
+            and not task.done()
+            and task is not asyncio.current_task()
+        ):
+            await asyncio.wait([task], timeout=self.TIMEOUT)
+
     #
     # Send Bytes
     #
@@ -249,21 +384,32 @@ class APIBase(ABC):
     async def _send_bytes(self):
         try:
             self._log_debug(f"Send task started for {self.host}:{self.port}")
+            queue = self._writer_queue
             while self.connected:
                 # Wait until there's data in the queue
-                data = await self._writer_queue.get()
+                while not queue:
+                    self._writer_wakeup.clear()
+                    await self._writer_wakeup.wait()
+
+                data = queue.popleft()
 
-                if not isinstance(data, bytearray):
-                    Exception("Currently only accept Bytearray!")
+                # Coalesce what else is already queued into the same write
+                if self.SEND_COALESCE_BYTES and queue:
+                    data = bytearray(data)
+                    while queue and len(data) < self.SEND_COALESCE_BYTES:
+                        data += queue.popleft()
 
                 # Send the data
                 self._writer.write(data)
                 await self._writer.drain()
 
-                self._log_debug(f"Sent to {self.host}:{self.port}: {data.hex()}")
+                if self._is_log_level("debug"):
+                    self._log_debug(
+                        "Sent to %s:%s: %s", self.host, self.port, data.hex()
+                    )
 
                 # VSSL cant handle too many requests.
-                await asyncio.sleep(0.2)
+                await asyncio.sleep(self.SEND_INTERVAL)
 
         except asyncio.CancelledError:
             self._log_debug(f"Cancelled send task for {self.host}:{self.port}")
@@ -274,19 +420,24 @@ class APIBase(ABC):
     #
     # Response Task Loop
     #
+    # Each API defines a fixed HEADER_LENGTH, read the whole header in one go
+    # and let the API read the rest of the frame
+    #
     @final
-    async def _receive_first_byte(self):
+    async def _receive_header(self):
         try:
             self._log_debug(f"Receive task started for {self.host}:{self.port}")
-            while self.connected:
-                data = await self._reader.readexactly(self.FRIST_BYTE)
+            # The reader and header length are fixed for this connection
+            reader = self._reader
+            readexactly = reader.readexactly
+            header_length = self.HEADER_LENGTH
 
-                if not data:
-                    continue
+            while self.connected:
+                data = await readexactly(header_length)
 
                 self._keep_alive_received = True
 
-                await self._read_byte_stream(self._reader, data)
+                await self._read_byte_stream(reader, data)
 
         except asyncio.CancelledError:
             self._log_debug(f"Cancelled receive task for {self.host}:{self.port}")
@@ -299,6 +450,12 @@ class APIBase(ABC):
             self._log_error(f"Lost connection to host {self.host}:{self.port}")
             await self.reconnect()
 
+    #
+    # Cancel requests the API has scheduled but not yet sent
+    #
+    def _cancel_pending_requests(self):
+        pass
+
     #
     # Read the byte stream
     #
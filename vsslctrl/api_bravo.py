@@ -1,20 +1,51 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-import json
 import struct
 import logging
 
 from .api_base import APIBase
-from .utils import hex_to_int, hex_to_bytearray_string
+from .utils import bytes_to_bytearray_string, json_loads
 from .decorators import logging_helpers
 from .data_structure import TrackMetadataExtKeys
 
+_LEN_H = struct.Struct(">H")
+
+# 0xAAAA, get (1) or set (2), command, 4 zero bytes, data length, 0
+_REQUEST_HEADER = struct.Struct(">HBB4xBx")
+
+
+#
+# Build a request, header and data are packed in one go
+#
+def _build_request(command: int, get=True, data: bytes = b"") -> bytes:
+    return _REQUEST_HEADER.pack(0xAAAA, 1 if get else 2, command, len(data)) + data
+
+
+#
+# Decode the ASCII payload of a frame, its length is the big endian
+# short at bytes 8 and 9 of the header
+#
+def _frame_data(response: bytes) -> str:
+    (length,) = _LEN_H.unpack_from(response, 8)
+    return str(memoryview(response)[10 : 10 + length], "ascii")
+
 
 @logging_helpers()
 class APIBravo(APIBase):
     TCP_PORT = 7777
     HEADER_LENGTH = 10
 
+    __slots__ = (
+        "_log_prefix",
+        "vssl",
+        "zone",
+        "_action_handlers",
+        "_set_zone",
+        "_set_settings",
+        "_track_frame",
+        "_keepalive_request",
+    )
+
     def __init__(self, vssl_host: "vssl.VSSL", zone: "zone.Zone"):
         super().__init__(host=zone.host, port=self.TCP_PORT)
 
@@ -23,6 +54,36 @@ class APIBravo(APIBase):
         self.vssl = vssl_host
         self.zone = zone
 
+        self._build_response_handlers()
+
+        # Bind the property setters once, the handlers call them on every frame
+        self._set_zone = zone._set_property
+        self._set_settings = zone.settings._set_property
+
+        # Last track metadata frame parsed and the group source it was parsed for
+        self._track_frame = None
+
+        # Keep alive registers the zone host, which is immutable
+        self._keepalive_request = self._build_request_with_data(3, zone.host)
+
+    #
+    # Resolve the response_action_XX handlers once into a table indexed by the
+    # action byte
+    #
+    def _build_response_handlers(self):
+        self._action_handlers = [self.response_action_default] * 256
+
+        for name in dir(type(self)):
+            if not name.startswith("response_action_"):
+                continue
+
+            code = name[len("response_action_") :]
+            try:
+                if len(code) == 2:
+                    self._action_handlers[int(code, 16)] = getattr(self, name)
+            except ValueError:
+                continue
+
     #
     # Send keep alive
     #
@@ -36,19 +97,12 @@ class APIBravo(APIBase):
     #
     #
     #
-    def _build_request(self, command: int, get=True):
-        setget = 1 if get else 2
-        return bytearray([170, 170, setget, command, 0, 0, 0, 0])
 
     #
     # Request with data
     #
     def _build_request_with_data(self, cmd: int, data: str):
-        command = self._build_request(cmd, False)
-        command.extend(struct.pack(">B", len(data)))
-        command.extend([0])
-        command.extend(data.encode("utf-8"))
-        return command
+        return _build_request(cmd, False, data.encode("utf-8"))
 
     #
     # 03 [3]
@@ -56,7 +110,9 @@ class APIBravo(APIBase):
     #
     def request_action_03(self):
         self._log_debug("Sending keep alive with IP")
-        self.send(self._build_request_with_data(3, self.zone.host))
+        self.send(self._keepalive_request)
+
+    NAME_REQUEST = _build_request(90)
 
     #
     # 5A [90]
@@ -64,37 +120,42 @@ class APIBravo(APIBase):
     #
     def request_action_5A(self):
         self._log_debug("Requesting name")
-        command = self._build_request(90)
-        command.extend([0, 0])
-        self.send(command)
+        self.send(self.NAME_REQUEST)
 
     #
     # 5A [90]
     # Zone Name - Rename
     #
     def request_action_5A_set(self, name: str):
-        self._log_debug(f"Requesting to set name: {name}")
+        self._log_debug("Requesting to set name: %s", name)
         self.send(self._build_request_with_data(90, name))
 
+    MAC_ADDRESS_REQUEST = _build_request(91)
+
     #
     # 5B [91]
     # MAC Address
     #
     def request_action_5B(self):
         self._log_debug("Requesting MAC address")
-        command = self._build_request(91)
-        command.extend([0, 0])
-        self.send(command)
+        self.send(self.MAC_ADDRESS_REQUEST)
+
+    TRACK_REQUEST = _build_request(42)
 
     #
     # 2A [42]
     # Track Metadata
     #
-    def request_action_2A(self):
+    # refresh: apply the response even if it repeats the last one, e.g the
+    # transport state changed and the track was reset since
+    #
+    def request_action_2A(self, refresh: bool = False):
         self._log_debug("Requesting track metadata")
-        command = self._build_request(42)
-        command.extend([0, 0])
-        self.send(command)
+        if refresh:
+            self._track_frame = None
+        self.send(self.TRACK_REQUEST)
+
+    NEXT_TRACK_REQUEST = _build_request(40, False, b"NEXT")
 
     #
     # 28 [40]
@@ -105,9 +166,10 @@ class APIBravo(APIBase):
     #
     def request_action_40_next(self):
         self._log_debug("Requesting next track")
-        command = self._build_request(40, False)
-        command.extend([4, 0, 78, 69, 88, 84])
-        self.send(command)
+        self.send(self.NEXT_TRACK_REQUEST)
+
+    # Length of 8 matches the captured request below
+    PREV_TRACK_REQUEST = _REQUEST_HEADER.pack(0xAAAA, 2, 40, 8) + b"PREV"
 
     #
     # 28 [40]
@@ -118,9 +180,9 @@ class APIBravo(APIBase):
     #
     def request_action_40_prev(self):
         self._log_debug("Requesting previous track")
-        command = self._build_request(40, False)
-        command.extend([8, 0, 80, 82, 69, 86])
-        self.send(command)
+        self.send(self.PREV_TRACK_REQUEST)
+
+    VOLUME_REQUEST = _build_request(64)
 
     #
     # 40 [64]
@@ -128,9 +190,7 @@ class APIBravo(APIBase):
     #
     def request_action_64(self):
         self._log_debug("Requesting volume")
-        command = self._build_request(64)
-        command.extend([0, 0])
-        self.send(command)
+        self.send(self.VOLUME_REQUEST)
 
     #
     #
@@ -145,82 +205,74 @@ class APIBravo(APIBase):
     #
 
     async def _read_byte_stream(self, reader, data):
-        data += await reader.readexactly(self.HEADER_LENGTH - APIBase.FRIST_BYTE)
-
-        length = int.from_bytes(data[8:10], "big")
+        (length,) = _LEN_H.unpack_from(data, 8)
 
         data += await reader.readexactly(length)
 
-        self._log_debug(f"Response: {data}")
+        if self._is_log_level("debug"):
+            self._log_debug(f"Response: {data}")
 
         await self._handle_response(data)
 
     async def _handle_response(self, response: bytes):
         try:
-            # Convert to HEX and split into a array
-            hexl = response.hex("-").split("-")
-            action = f"response_action_{hexl[4].upper()}"
-            length = hexl[2]
+            # The action is the fifth byte and indexes the handler table
+            method = self._action_handlers[response[4]]
 
-            self._log_debug(f"Response action: {action}")
+            if self._is_log_level("debug"):
+                self._log_debug(f"Response action: {method.__name__}")
 
         except Exception as error:
-            self._log_error(f"Couldnt handle response: {error} | {hexl} | {response}")
+            self._log_error(f"Couldnt handle response: {error} | {response}")
             return None
 
-        if hasattr(self, action):
-            method = getattr(self, action)
-            if callable(method):
-                return method(hexl, response)
-        # Default
-        return self.response_action_default(hexl, response)
+        return method(response)
 
     #
     # Extract Data
     #
     def _extract_response_data(self, response: bytes, length_index: int = 9):
         try:
-            header = response[:9]
-            length_field = response[8:10]
-            length = int.from_bytes(length_field, "big")
-            return response[10 : 10 + length].decode("ascii")
+            return _frame_data(response)
         except Exception as e:
             self._log_error(
-                f"Unable to extract response data. Exception: {e} | Response: {hexl}"
+                "Unable to extract response data. Exception: %s | Response: %s",
+                e,
+                response,
             )
 
     #
     # 03 [3]
     # Keep Alive
     #
-    def response_action_03(self, hexl: list, response: bytes):
-        if hex_to_int(hexl[5]) != 1:
-            self._log_debug(f"Couldnt register, trying again", "critical")
+    def response_action_03(self, response: bytes):
+        if response[5] != 1:
+            self._log_critical("Couldnt register, trying again")
             self.request_action_03()
 
-        self._log_debug(f"Received keep alive")
+        self._log_debug("Received keep alive")
 
     #
     # 5A [90]
     # Zone Name
     #
-    def response_action_5A(self, hexl: list, response: bytes):
+    def response_action_5A(self, response: bytes):
         name = self._extract_response_data(response)
-        self._log_debug(f"Received zone name: {name}")
-        self.zone.settings._set_property("name", name.strip())
+        self._log_debug("Received zone name: %s", name)
+        self._set_settings("name", name.strip())
 
     #
     # 31 [49]
     # Progress
     #
-    def response_action_31(self, hexl: list, response: bytes):
+    def response_action_31(self, response: bytes):
         self.zone.track.progress = int(self._extract_response_data(response))
 
     #
     # 2A [42]
     # Track Metadata
     #
-    def response_action_2A(self, hexl: list, response: bytes):
+    def response_action_2A(self, response: bytes):
         """
 
         Example PlayView Response:
@@ -233,8 +285,14 @@ class APIBravo(APIBase):
         'TotalTime': 203087, 'TrackName': 'Beijing'}
         """
         try:
-            jsonr = response[10:]
-            metadata = json.loads(jsonr)
+            # The same track info is pushed and polled over and over, skip the
+            # parse when the frame and the group it applies to are unchanged
+            track_frame = (response, self.zone.group.source)
+            if track_frame == self._track_frame:
+                return
+            self._track_frame = track_frame
+
+            metadata = json_loads(memoryview(response)[self.HEADER_LENGTH :])
             # CMD ID = 1 BrowseView - VSSL File Browser
             # CMD ID = 3 PlayView (Track Info)
             if (
@@ -246,26 +304,30 @@ class APIBravo(APIBase):
                 self.zone.transport._map_response_dict(track_data)
             else:
                 self._log_debug(
-                    f"{metadata[TrackMetadataExtKeys.WINDOW_TITLE]} is currently unsupported: {metadata}"
+                    "%s is currently unsupported: %s",
+                    metadata[TrackMetadataExtKeys.WINDOW_TITLE],
+                    metadata,
                 )
 
         except Exception as e:
-            self._log_error(f"Unable to parse JSON. Exception: {e} | Response: {hexl}")
+            self._log_error(
+                f"Unable to parse JSON. Exception: {e} | Response: {response}"
+            )
 
     #
     # 2D [45]
     # Track Metadata from Track Next and Track Previous responses
     #
-    def response_action_2D(self, hexl: list, response: bytes):
-        self.response_action_2A(hexl, response)
+    def response_action_2D(self, response: bytes):
+        self.response_action_2A(response)
 
     #
     # 32 [50]
     # Track Source Update
     #
-    def response_action_32(self, hexl: list, response: bytes):
+    def response_action_32(self, response: bytes):
         self.zone.track.source = int(self._extract_response_data(response))
-        self._log_debug(f"Received stream source: {self.zone.track.source}")
+        self._log_debug("Received stream source: %s", self.zone.track.source)
 
     #
     # 33 [51]
@@ -278,11 +340,11 @@ class APIBravo(APIBase):
     # Stop = 1
     # Pause = 2
     #
-    def response_action_33(self, hexl: list, response: bytes):
+    def response_action_33(self, response: bytes):
         """
         Alpha API will handle transport state
 
-        self._log_debug(f"Received transport state 33: {hexl}")
+        self._log_debug(f"Received transport state 33: {response.hex()}")
         state = int(self._extract_response_data(response))
 
         if state == 0:
@@ -305,27 +367,27 @@ class APIBravo(APIBase):
     # error_playfail
     # error_nonextsong
     #
-    def response_action_36(self, hexl: list, response: bytes):
+    def response_action_36(self, response: bytes):
         feedback = self._extract_response_data(response).split("_")
         if len(feedback) > 1:
-            self._log_debug(f"Received feedback {feedback[0]}: {feedback[1]}")
+            self._log_debug("Received feedback %s: %s", feedback[0], feedback[1])
         else:
-            self._log_debug(f"Received feedback: {feedback[0]}")
+            self._log_debug("Received feedback: %s", feedback[0])
 
     #
     # 3F [63]
     # Mute Status
     #
-    def response_action_3F(self, hexl: list, response: bytes):
+    def response_action_3F(self, response: bytes):
         """
         Alpha API will handle the mute feedback
 
         state = self._extract_response_data(response)
         self._log_debug(f"Received mute status: {state}")
         if state == "MUTE":
-            self.zone._set_property('mute', True)
+            self._set_zone('mute', True)
         elif state == "UNMUTE":
-            self.zone._set_property('mute', False)
+            self._set_zone('mute', False)
 
         """
         return
@@ -334,7 +396,7 @@ class APIBravo(APIBase):
     # 40 [64]
     # Zone Volume Feedback
     #
-    def response_action_40(self, hexl: list, response: bytes):
+    def response_action_40(self, response: bytes):
         """
         Alpha API will handle the volume, there is some strange behavior
         that the Bravo API gets a 0 vol when the zone is muted, but then
@@ -343,7 +405,7 @@ class APIBravo(APIBase):
 
         vol = int(self._extract_response_data(response))
         self._log_debug(f"Received volume: {vol}%")
-        self.zone._set_property('volume', int(vol))
+        self._set_zone('volume', int(vol))
 
         """
         return
@@ -352,8 +414,11 @@ class APIBravo(APIBase):
     # 46 [70]
     # Unknown | Speaker active / inactive
     #
-    def response_action_46(self, hexl: list, response: bytes):
-        self._log_debug(f"Received Unknown 46: {self._extract_response_data(response)}")
+    def response_action_46(self, response: bytes):
+        if self._is_log_level("debug"):
+            self._log_debug(
+                "Received Unknown 46: %s", self._extract_response_data(response)
+            )
 
         """
             This looks to be a stream update, Speaker active and stream input. 
@@ -370,8 +435,11 @@ class APIBravo(APIBase):
     # 4E [78]
     # Unknown | Looks to be like a comfirmation feedback
     #
-    def response_action_4E(self, hexl: list, response: bytes):
-        self._log_debug(f"Received Unknown 4E: {self._extract_response_data(response)}")
+    def response_action_4E(self, response: bytes):
+        if self._is_log_level("debug"):
+            self._log_debug(
+                "Received Unknown 4E: %s", self._extract_response_data(response)
+            )
 
         """
 
@@ -384,17 +452,20 @@ class APIBravo(APIBase):
     # 4F [79]
     # Unknown | Status Change?!
     #
-    def response_action_4F(self, hexl: list, response: bytes):
-        self._log_debug(f"Received Unknown 4F {self._extract_response_data(response)}")
+    def response_action_4F(self, response: bytes):
+        if self._is_log_level("debug"):
+            self._log_debug(
+                "Received Unknown 4F %s", self._extract_response_data(response)
+            )
 
     #
     # 5B [91]
     # MAC Address
     #
-    def response_action_5B(self, hexl: list, response: bytes):
+    def response_action_5B(self, response: bytes):
         mac = self._extract_response_data(response)
-        self._log_debug(f"Received MAC address: {mac}")
-        self.zone._set_property("mac_addr", mac)
+        self._log_debug("Received MAC address: %s", mac)
+        self._set_zone("mac_addr", mac)
 
     #
     # 70 [112]
@@ -405,17 +476,21 @@ class APIBravo(APIBase):
     #
     # NOTE: This will be a feedback for ALL zones not just this zone
     #
-    def response_action_70(self, hexl: list, response: bytes):
-        length = 4 if hexl[0] == 16 else 10
-        cmd = response[length:].hex()
-        self._log_debug(
-            f"Received command confimation: {hex_to_bytearray_string(cmd)} Hex: {cmd}"
-        )
+    def response_action_70(self, response: bytes):
+        if self._is_log_level("debug"):
+            length = 4 if response[0] == 0x10 else 10
+            cmd = response[length:]
+            self._log_debug(
+                "Received command confimation: %s Hex: %s",
+                bytes_to_bytearray_string(cmd),
+                cmd.hex(),
+            )
 
     #
     # Default
     # Default Action
     #
-    def response_action_default(self, hexl: list, response: bytes):
-        string = self._extract_response_data(response)
-        self._log_debug(f"Unknown command {hexl[1].upper()}: {string}")
+    def response_action_default(self, response: bytes):
+        if self._is_log_level("debug"):
+            string = self._extract_response_data(response)
+            self._log_debug("Unknown command %02X: %s", response[4], string)
@@ -31,7 +31,7 @@ class Vssl:
     def __init__(
         self,
         model: Models = None,
-        zones: Union[str, List[str]] = None,
+        zones: Union[str, List[str], Dict[ZoneIDs, str]] = None,
     ):
         self.event_bus = EventBus()
         self.zones = {}
@@ -214,17 +214,21 @@ class Vssl:
     # Disconnect / Shutdown
     #
     async def disconnect(self):
-        for zone in self.zones.values():
-            await zone.disconnect()
+        # Each zone has its own connections, close them all at once
+        await asyncio.gather(*(zone.disconnect() for zone in self.zones.values()))
 
     #
-    # Add a Zones using a List, index emplys the zone ID
+    # Add a Zones using a List, index emplys the zone ID. Or a Dict of zone IDs
+    # to hosts
     #
-    def add_zones(self, zones=Union[str, List[str]]):
-        zones_list = [zones] if isinstance(zones, str) else zones
+    def add_zones(self, zones: Union[str, List[str], Dict[ZoneIDs, str]]):
+        if isinstance(zones, dict):
+            zones_dict = zones
+        else:
+            zones_list = [zones] if isinstance(zones, str) else zones
+            zones_dict = {index + 1: ip for index, ip in enumerate(zones_list)}
 
-        for index, ip in enumerate(zones_list):
-            self.add_zone(index + 1, ip)
+        return [self.add_zone(zone_id, ip) for zone_id, ip in zones_dict.items()]
 
     #
     # Add a Zone
@@ -32,29 +32,37 @@ def logging_helpers(prefix=""):
     def decorator(cls):
         logger = logging.getLogger(__name__)
 
+        LOG_LEVELS = {"debug", "info", "warning", "error", "critical"}
+        LEVEL_NUMBERS = {level: getattr(logging, level.upper()) for level in LOG_LEVELS}
+
         def _is_log_level(self, level: str):
-            level = level.upper()
-            if hasattr(logging, level):
-                return getattr(logging, level) == logger.getEffectiveLevel()
-            else:
-                return False
+            """Is the log level enabled, use to guard building expensive messages"""
+            level_no = LEVEL_NUMBERS.get(level)
+            if level_no is None:
+                level_no = getattr(logging, level.upper(), None)
+                if not isinstance(level_no, int):
+                    return False
+            return logger.isEnabledFor(level_no)
 
         setattr(cls, "_is_log_level", _is_log_level)
 
-        LOG_LEVELS = {"debug", "info", "warning", "error", "critical"}
-
-        def create_log_function(log_level, prefix=prefix):  # Pass prefix here
-            def log_function(self, message):  # Rename prefix to custom_prefix
-                final_prefix = getattr(self, "_log_prefix", prefix)
-                log_level(f"{final_prefix} {message}")
+        def create_log_function(log_level, level_no, prefix=prefix):
+            def log_function(self, message, *args):
+                # Skip building the prefixed message if the level is disabled.
+                # Any args are %-formatted into the message lazily by logging
+                if logger.isEnabledFor(level_no):
+                    final_prefix = getattr(self, "_log_prefix", prefix)
+                    log_level(f"{final_prefix} {message}", *args)
 
             return log_function
 
         for level in LOG_LEVELS:
             log_func = getattr(logger, level)
             setattr(
-                cls, f"_log_{level}", create_log_function(log_func)
-            )  # Pass prefix here
+                cls,
+                f"_log_{level}",
+                create_log_function(log_func, LEVEL_NUMBERS[level]),
+            )
 
         return cls
 
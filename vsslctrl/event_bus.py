@@ -1,9 +1,20 @@
 import asyncio
 import traceback
 from enum import IntEnum
-from typing import Callable
+from typing import Any, Callable, NamedTuple
 from .exceptions import VsslCtrlException
 from .decorators import logging_helpers
+from .utils import wait_with_timeout
+
+
+#
+# Subscription record returned by EventBus.subscribers
+#
+class Subscription(NamedTuple):
+    callback: Callable
+    entity: Any
+    once: bool
+
 
 #
 # Event Bus
@@ -16,21 +27,56 @@ class EventBus:
     FUTURE_TIMEOUT = 5
 
     def __init__(self):
-        self.subscribers = {}
+        # Subscriptions are stored as parallel lists per event type
+        self._callbacks = {}
+        self._entities = {}
+        self._once = {}
+        self._futures = {}
+        self._streams = {}
         self.event_queue = asyncio.Queue()
 
         self.running = False
+        self._stopped = False
 
         self.process = asyncio.create_task(self.process_events())
 
     #
     # Stop
     #
+    # Safe to call more than once. Doesnt wait for the process task to finish,
+    # any events still queued are discarded
+    #
     def stop(self):
+        if self._stopped:
+            return
+
+        self._stopped = True
         self.running = False
         self.process.cancel()
+
+        while not self.event_queue.empty():
+            self.event_queue.get_nowait()
+            self.event_queue.task_done()
+
         self._log_debug(f"stopped event processing")
 
+    #
+    # Subscribers as Subscription(callback, entity, once) tuples per event type
+    #
+    @property
+    def subscribers(self):
+        return {
+            event_type: list(
+                map(
+                    Subscription,
+                    callbacks,
+                    self._entities[event_type],
+                    self._once[event_type],
+                )
+            )
+            for event_type, callbacks in self._callbacks.items()
+        }
+
     #
     # Subscribe
     #
@@ -38,12 +84,12 @@ class EventBus:
         # Make sure we are using async callbacks
         if callback is not None and asyncio.iscoroutinefunction(callback):
             event_type = event_type.lower()
-            if event_type not in self.subscribers:
-                self.subscribers[event_type] = []
             self._log_debug(
                 f"subscription for event: {event_type} | entity: {entity} | cb: {callback.__name__}"
             )
-            self.subscribers[event_type].append((callback, entity, once))
+            self._callbacks.setdefault(event_type, []).append(callback)
+            self._entities.setdefault(event_type, []).append(entity)
+            self._once.setdefault(event_type, []).append(once)
         else:
             message = f"{callback.__name__} must be a coroutine. Event: {event_type} | Entity: {entity}"
             self._log_error(message)
@@ -54,32 +100,104 @@ class EventBus:
     #
     def unsubscribe(self, event_type, callback):
         event_type = event_type.lower()
-        if event_type in self.subscribers:
-            self.subscribers[event_type] = [
-                cb for cb in self.subscribers[event_type] if cb[0] != callback
-            ]
+        callbacks = self._callbacks.get(event_type)
+        if callbacks is not None:
+            keep = [cb != callback for cb in callbacks]
+            for subscriptions in (self._callbacks, self._entities, self._once):
+                subscriptions[event_type] = [
+                    value
+                    for value, keep_value in zip(subscriptions[event_type], keep)
+                    if keep_value
+                ]
 
     #
     # Get a future value from the event bus
     #
+    # Futures are kept apart from the subscribers, they are resolved and
+    # dropped the first time a matching event is processed
+    #
     def future(self, event_type, entity=None) -> asyncio.Future:
-        future = asyncio.Future()
+        future = asyncio.get_running_loop().create_future()
+
+        futures = self._futures.setdefault(event_type.lower(), {})
+        pending = futures.setdefault(entity, [])
+        pending.append(future)
 
-        async def future_callback(data, *args):
-            nonlocal future
-            future.set_result(data)
+        # Forget the future if it is cancelled e.g wait_for timed out
+        def discard(done_future):
+            if done_future.cancelled() and done_future in pending:
+                pending.remove(done_future)
+                # Dont leave an empty list behind for the entity
+                if not pending and futures.get(entity) is pending:
+                    del futures[entity]
 
-        self.subscribe(event_type, future_callback, entity, once=True)
+        future.add_done_callback(discard)
 
         return future
 
+    #
+    # Resolve the futures waiting on an event
+    #
+    def _resolve_futures(self, event, entity, data):
+        futures = self._futures.get(event)
+        if not futures:
+            return
+
+        if entity is None:
+            entities = list(futures)
+        else:
+            entities = [key for key in (entity, self.WILDCARD) if key in futures]
+
+        for key in entities:
+            for future in futures.pop(key):
+                if not future.done():
+                    future.set_result(data)
+
+    #
+    # Stream events into a queue
+    #
+    # Unlike a future the queue stays registered until close_stream is called,
+    # so a run of the same event only needs the one registration. Entities are
+    # matched the same as subscribers
+    #
+    def stream(self, event_type, entity=WILDCARD) -> asyncio.Queue:
+        queue = asyncio.Queue()
+        streams = self._streams.setdefault(event_type.lower(), {})
+        streams.setdefault(entity, []).append(queue)
+        return queue
+
+    def close_stream(self, event_type, queue: asyncio.Queue):
+        streams = self._streams.get(event_type.lower(), {})
+        for entity, queues in list(streams.items()):
+            if queue in queues:
+                queues.remove(queue)
+            if not queues:
+                del streams[entity]
+
+    #
+    # Put an event on the queues streaming it
+    #
+    def _feed_streams(self, event, entity, data):
+        streams = self._streams.get(event)
+        if not streams:
+            return
+
+        if entity is None:
+            entities = list(streams)
+        else:
+            entities = [key for key in (entity, self.WILDCARD) if key in streams]
+
+        for key in entities:
+            for queue in streams[key]:
+                queue.put_nowait(data)
+
     #
     # Helper to await a future with a timeout
     #
     async def wait_future(self, future, timeout: int = FUTURE_TIMEOUT):
         if timeout != 0:
             try:
-                return await asyncio.wait_for(future, timeout)
+                return await wait_with_timeout(future, timeout)
             except asyncio.TimeoutError as error:
                 self._log_error(f"timeout waiting for future")
                 raise error
@@ -105,8 +223,11 @@ class EventBus:
     #
     # Publish
     #
+    # The queue is unbounded so there is no need to create a task to put the
+    # event, the process_events loop will pick it up on its next iteration
+    #
     def publish(self, event_type, entity=None, data=None):
-        asyncio.create_task(self.publish_async(event_type, entity, data))
+        self.event_queue.put_nowait((event_type.lower(), entity, data))
 
     #
     # Publish Async (Use when inside events loop)
@@ -115,6 +236,12 @@ class EventBus:
         event_type = event_type.lower()
         await self.event_queue.put((event_type, entity, data))
 
+    #
+    # Wait until all the queued events have been dispatched
+    #
+    async def join(self):
+        await self.event_queue.join()
+
     #
     # Process Events
     #
@@ -125,7 +252,10 @@ class EventBus:
         while self.running:
             try:
                 event_type, entity, data = await self.event_queue.get()
+            except asyncio.CancelledError:
+                break
 
+            try:
                 if self._is_log_level("debug"):
                     message = (
                         f"processing event: {event_type} | entity: {entity} | data: "
@@ -136,19 +266,41 @@ class EventBus:
                         message += str(data)
                     self._log_debug(message)
 
-                for event in [event_type, self.WILDCARD]:
-                    if event in self.subscribers:
-                        for callback, subscribed_entity, once in self.subscribers[
-                            event
-                        ]:
-                            if entity is None or subscribed_entity in {
+                callbacks = []
+                for event in (event_type, self.WILDCARD):
+                    self._resolve_futures(event, entity, data)
+                    self._feed_streams(event, entity, data)
+
+                    subscribed_callbacks = self._callbacks.get(event)
+                    if subscribed_callbacks:
+                        entities = self._entities[event]
+                        once = self._once[event]
+                        for index, callback in enumerate(subscribed_callbacks):
+                            if entity is None or entities[index] in {
                                 entity,
                                 self.WILDCARD,
                             }:
-                                await callback(data, entity, event_type)
-                                if once:
+                                callbacks.append(callback)
+                                if once[index]:
                                     self.unsubscribe(event, callback)
 
+                # Fan out to all the subscribers at once
+                results = await asyncio.gather(
+                    *[callback(data, entity, event_type) for callback in callbacks],
+                    return_exceptions=True,
+                )
+
+                for callback, result in zip(callbacks, results):
+                    if isinstance(result, Exception):
+                        self._log_error(
+                            f"exception occurred in {callback.__name__} processing event: {event_type} | {result}\n"
+                            + "".join(
+                                traceback.format_exception(
+                                    type(result), result, result.__traceback__
+                                )
+                            )
+                        )
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -157,3 +309,5 @@ class EventBus:
                 self._log_error(
                     f"exception occurred processing event: {e}\n{traceback_str}"
                 )
+            finally:
+                self.event_queue.task_done()
@@ -1,5 +1,19 @@
 import asyncio
 
+#
+# JSON parsing, use orjson when it is installed. Both accept bytes, only orjson
+# accepts a memoryview so the stdlib fallback copies it
+#
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+    def json_loads(data):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return _json_loads(data)
+
 
 #
 # Hex to Int
@@ -11,8 +25,15 @@ def hex_to_int(str: str, base: int = 16):
 #
 # Clamp Volume
 #
+# Comparisons rather than max(min()) as this runs for every volume request
+#
+VOLUME_MIN = 0
+VOLUME_MAX = 100
+
+
 def clamp_volume(vol: int):
-    return max(0, min(int(vol), 100))
+    vol = int(vol)
+    return VOLUME_MIN if vol < VOLUME_MIN else VOLUME_MAX if vol > VOLUME_MAX else vol
 
 
 #
@@ -26,6 +47,19 @@ def cancel_task(task: asyncio.Task):
             pass
 
 
+#
+# Await with a timeout
+#
+# asyncio.timeout (Python 3.11+) doesnt wrap the awaitable in a new task like
+# asyncio.wait_for does. Both raise asyncio.TimeoutError
+#
+async def wait_with_timeout(aw, timeout: float):
+    if hasattr(asyncio, "timeout"):
+        async with asyncio.timeout(timeout):
+            return await aw
+    return await asyncio.wait_for(aw, timeout)
+
+
 #
 # Groups dicts by property
 #
@@ -41,14 +75,16 @@ def group_list_by_property(input_list, property_key):
 #
 # Logging Helper to show a command in bytearray([]) syntax
 #
-def hex_to_bytearray_string(hex_string):
-    # Convert the hex string to a bytearray
-    byte_array = bytearray.fromhex(hex_string)
+# The decimal text of every byte value, indexed by the byte
+_BYTE_STRINGS = tuple(str(i) for i in range(256))
+
 
-    # Create the bytearray string representation
-    bytearray_str = f'bytearray([{", ".join(map(str, byte_array))}])'
+def bytes_to_bytearray_string(data: bytes):
+    return f'bytearray([{", ".join([_BYTE_STRINGS[b] for b in data])}])'
 
-    return bytearray_str
+
+def hex_to_bytearray_string(hex_string):
+    return bytes_to_bytearray_string(bytes.fromhex(hex_string))
 
 
 #
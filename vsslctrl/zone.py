@@ -99,8 +99,19 @@ class Zone:
 
         # Connect the APIs
         # Wait until the zone is connected then continue
-        await self.api_alpha.connect()
-        await self.api_bravo.connect()
+        #
+        # Both APIs connect at the same time. If either fails, disconnect the
+        # one that did connect before raising so its connection is not left open
+        apis = (self.api_alpha, self.api_bravo)
+        results = await asyncio.gather(
+            *(api.connect() for api in apis), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            for api, result in zip(apis, results):
+                if not isinstance(result, BaseException):
+                    await api.disconnect()
+            raise errors[0]
 
         # Start polling zone
         self._poller.start()
@@ -146,8 +157,7 @@ class Zone:
         """Disconnect / Shutdown"""
         self._poller.cancel()
 
-        await self.api_alpha.disconnect()
-        await self.api_bravo.disconnect()
+        await asyncio.gather(self.api_alpha.disconnect(), self.api_bravo.disconnect())
 
     def _event_publish(self, event_type, data=None):
         """Event Publish Wrapper"""
@@ -166,10 +176,13 @@ class Zone:
 
         """
         if not self.transport.is_stopped:
-            self._request_track()
+            self._request_track(refresh=True)
         else:
             self.track.set_defaults()
             self.transport.set_defaults()
+            # Status frames repeating what was applied before the reset must
+            # be applied again
+            self._request_status(refresh=True)
 
     async def _event_group_source_change(self, source: int, *args):
         """Propgate the track metadata from a group master to its members"""
@@ -396,8 +409,8 @@ class Zone:
         self.api_alpha.request_action_00_00()
         return self
 
-    def _request_status(self):
-        self.api_alpha.request_action_00_08()
+    def _request_status(self, refresh: bool = False):
+        self.api_alpha.request_action_00_08(refresh)
         return self
 
     def _request_eq_status(self):
@@ -412,8 +425,8 @@ class Zone:
         self.api_alpha.request_action_00_0B()
         return self
 
-    def _request_track(self):
-        self.api_bravo.request_action_2A()
+    def _request_track(self, refresh: bool = False):
+        self.api_bravo.request_action_2A(refresh)
         return self
 
 